@@ -5,12 +5,28 @@ Local test script - tests embeddings without Solr.
 Usage:
   python test_local.py           # Test with DJL container
   python test_local.py --local   # Test with local sentence-transformers
+  python test_local.py --onnx    # Test with an ONNX export via onnxruntime
+  python test_local.py --async   # Test with DJL container via the asyncio client
+  python test_local.py --gzip    # Gzip large DJL request bodies (endpoint must accept them)
 """
 
 import argparse
+import asyncio
+import gzip
+import hashlib
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 import os
+import queue
+import threading
+from itertools import islice
 
 load_dotenv("config.env")
 
@@ -19,19 +35,109 @@ CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "512"))
 CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "50"))
 MODEL_NAME = os.getenv("MODEL_NAME", "all-MiniLM-L6-v2")
 BATCH_SIZE = int(os.getenv("BATCH_SIZE", "64"))
+GZIP_MIN_BYTES = int(os.getenv("GZIP_MIN_BYTES", "8192"))  # Size threshold when --gzip is on
+ONNX_MODEL_PATH = os.getenv("ONNX_MODEL_PATH", f"{MODEL_NAME}.onnx")
+
+
+def iter_chunks(text: str, chunk_size: int, overlap: int) -> Iterator[str]:
+    """Yield fixed-size chunks with overlap, for streaming large documents."""
+    for start in _chunk_starts(len(text), chunk_size, overlap):
+        yield text[start : start + chunk_size]
+
+
+def _chunk_starts(length: int, chunk_size: int, overlap: int) -> range:
+    """Start offsets of every chunk: ceil(length / step) of them, one step apart."""
+    step = chunk_size - overlap
+    n = -(-length // step)
+    return range(0, n * step, step)
 
 
 def chunk_text(text: str, chunk_size: int, overlap: int) -> list[str]:
     """Split text into fixed-size chunks with overlap."""
-    if not text:
-        return []
-    chunks = []
-    start = 0
-    while start < len(text):
-        end = start + chunk_size
-        chunks.append(text[start:end])
-        start += chunk_size - overlap
-    return chunks
+    return [text[start : start + chunk_size] for start in _chunk_starts(len(text), chunk_size, overlap)]
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    """Consecutive lists of up to ``size`` items from any iterable."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _cached_encode(cache: dict, texts: list[str], encode) -> np.ndarray:
+    """Embed only texts whose content hash is not in ``cache``.
+
+    Keys are BLAKE2b digests of the UTF-8 text; repeats within one call are
+    embedded once. ``encode`` gets the misses and returns one row per text.
+    """
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+    keys = [hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest() for text in texts]
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in cache:
+            missing.setdefault(key, text)
+    if missing:
+        cache.update(zip(missing, encode(list(missing.values()))))
+    return np.stack([cache[key] for key in keys])
+
+
+def _word_count(text: str) -> int:
+    return len(text.split())
+
+
+def _smart_batch(texts: list, batch_size: int, embed_batch, map_batches=map, length=_word_count) -> np.ndarray:
+    """Embed texts in length-sorted batches so each batch pads to similar lengths.
+
+    ``length`` defaults to word count, a cheap token-length proxy; callers that
+    have already tokenized can sort on real token counts instead. ``map_batches``
+    runs ``embed_batch`` over the batches (e.g. ``executor.map`` to keep several
+    in flight), must yield one 2-D array per batch, in batch order. Rows of the
+    returned (len(texts), dim) array follow the original order of ``texts``.
+    """
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+    windows = _length_windows(texts, batch_size, length)
+    results = map_batches(embed_batch, [[texts[i] for i in window] for window in windows])
+    return _scatter(len(texts), windows, results)
+
+
+def _length_windows(texts: list, batch_size: int, length=_word_count) -> list[list[int]]:
+    """Indices of ``texts`` sorted by length, split into consecutive batches."""
+    order = sorted(range(len(texts)), key=lambda i: length(texts[i]))
+    return [order[start : start + batch_size] for start in range(0, len(order), batch_size)]
+
+
+def _scatter(n: int, windows: list[list[int]], results) -> np.ndarray:
+    """Write per-batch results back into an (n, dim) array in original order."""
+    vectors = None
+    for window, batch_vectors in zip(windows, results):
+        if vectors is None:
+            # Dimension is known once the first batch comes back
+            vectors = np.empty((n, batch_vectors.shape[1]), dtype=np.float32)
+        vectors[window] = batch_vectors
+    return vectors
+
+
+def _djl_request(batch: list[str], compress: bool = False) -> tuple[bytes, dict]:
+    """JSON body and headers for a DJL prediction request.
+
+    With ``compress``, bodies over GZIP_MIN_BYTES are gzipped; only enable it
+    for endpoints known to accept ``Content-Encoding: gzip``.
+    """
+    body = orjson.dumps({"inputs": batch})
+    headers = {"Content-Type": "application/json"}
+    if compress and GZIP_MIN_BYTES and len(body) > GZIP_MIN_BYTES:
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+    return body, headers
+
+
+def _djl_vectors(content: bytes) -> np.ndarray:
+    """Parse a DJL prediction response into a (batch, dim) array."""
+    result = orjson.loads(content)
+    vectors = result if isinstance(result, list) else result.get("data", result.get("embeddings", []))
+    return np.asarray(vectors, dtype=np.float32)
 
 
 # ---------------------------------------------------------------------------
@@ -39,20 +145,135 @@ def chunk_text(text: str, chunk_size: int, overlap: int) -> list[str]:
 # ---------------------------------------------------------------------------
 
 class DJLEmbedder:
-    def __init__(self, djl_url: str, batch_size: int):
+    def __init__(self, djl_url: str, batch_size: int, gzip_requests: bool = False):
+        self.djl_url = djl_url
+        self.batch_size = batch_size
+        self.gzip_requests = gzip_requests
+        # Pooled keep-alive connections instead of a new TCP (and TLS) handshake per batch
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.1))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Several batches in flight so client-side JSON work overlaps server inference
+        self.max_in_flight = min(8, os.cpu_count() or 1)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+        self._cache: dict[bytes, np.ndarray] = {}
+
+    def __del__(self):
+        executor = getattr(self, "executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+        session = getattr(self, "session", None)
+        if session is not None:
+            session.close()
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        return _cached_encode(self._cache, texts, self._encode)
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        return _smart_batch(texts, self.batch_size, self._post_batch, self.executor.map)
+
+    def encode_iter(self, texts: Iterable[str]) -> Iterator[np.ndarray]:
+        """Embed a stream of texts batch by batch, in input order.
+
+        A producer thread pulls the next batches from ``texts`` (e.g. a chunk
+        generator) while earlier ones are on the wire; the bounded queue keeps
+        at most two batches buffered. Batches go through the same content-hash
+        cache as ``encode`` and up to ``max_in_flight`` of them run on the
+        thread pool at once. Stopping early, or an error, stops the producer.
+        """
+        batches = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        done = object()
+        errors = []
+
+        def offer(item) -> bool:
+            # Give up once the consumer has gone away instead of blocking forever
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            try:
+                for batch in _batched(texts, self.batch_size):
+                    if not offer(batch):
+                        return
+            except Exception as e:
+                errors.append(e)
+            offer(done)
+
+        threading.Thread(target=produce, daemon=True).start()
+        pending = deque()
+        try:
+            while (batch := batches.get()) is not done:
+                pending.append(self.executor.submit(_cached_encode, self._cache, batch, self._post_batch))
+                if len(pending) >= self.max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+            if errors:
+                raise errors[0]
+        finally:
+            stop.set()
+            for future in pending:
+                future.cancel()
+
+    def _post_batch(self, batch: list[str]) -> np.ndarray:
+        body, headers = _djl_request(batch, self.gzip_requests)
+        # requests already sends Accept-Encoding: gzip and decompresses the response
+        resp = self.session.post(self.djl_url, data=body, headers=headers, timeout=60)
+        resp.raise_for_status()
+        return _djl_vectors(resp.content)
+
+    def ping(self) -> bool:
+        try:
+            ping_url = self.djl_url.replace("/predictions/all-MiniLM-L6-v2", "/ping")
+            resp = self.session.get(ping_url, timeout=5)
+            return resp.status_code == 200
+        except Exception:
+            return False
+
+
+class AsyncDJLEmbedder:
+    """DJL client that keeps many batches in flight from a single event loop."""
+
+    def __init__(self, djl_url: str, batch_size: int, max_in_flight: int = 32, gzip_requests: bool = False):
         self.djl_url = djl_url
         self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self.gzip_requests = gzip_requests
+        self._cache: dict[bytes, np.ndarray] = {}
+
+    async def aencode(self, texts: list[str]) -> np.ndarray:
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        windows = _length_windows(texts, self.batch_size)
+        results = await self._post_batches([[texts[i] for i in window] for window in windows])
+        return _scatter(len(texts), windows, results)
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        return _cached_encode(self._cache, texts, lambda misses: asyncio.run(self.aencode(misses)))
+
+    async def _post_batches(self, batches: list[list[str]]) -> list[np.ndarray]:
+        import aiohttp
 
-    def encode(self, texts: list[str]) -> list[list[float]]:
-        all_vectors = []
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i : i + self.batch_size]
-            resp = requests.post(self.djl_url, json={"inputs": batch}, timeout=60)
-            resp.raise_for_status()
-            result = resp.json()
-            vectors = result if isinstance(result, list) else result.get("data", result.get("embeddings", []))
-            all_vectors.extend(vectors)
-        return all_vectors
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight)
+        timeout = aiohttp.ClientTimeout(total=60)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+
+            async def post(batch: list[str]) -> np.ndarray:
+                body, headers = _djl_request(batch, self.gzip_requests)
+                async with semaphore:
+                    async with session.post(self.djl_url, data=body, headers=headers) as resp:
+                        resp.raise_for_status()
+                        return _djl_vectors(await resp.read())
+
+            return await asyncio.gather(*(post(batch) for batch in batches))
 
     def ping(self) -> bool:
         try:
@@ -63,10 +284,66 @@ class DJLEmbedder:
             return False
 
 
+_TORCH = None
+_MODELS: dict[tuple[str, str], object] = {}  # (model name, device) -> loaded SentenceTransformer
+
+
+def _torch():
+    """Import torch once, on first use (it is only needed for --local)."""
+    global _TORCH
+    if _TORCH is None:
+        # OpenMP/MKL read these once at load, so they must be set before torch is imported
+        cpu_threads = str(os.cpu_count() or 4)
+        os.environ.setdefault("OMP_NUM_THREADS", cpu_threads)
+        os.environ.setdefault("MKL_NUM_THREADS", cpu_threads)
+        import torch
+        _TORCH = torch
+    return _TORCH
+
+
+def _upcast_pooling(model):
+    """Pool and normalize in fp32 so reduced-precision activations don't accumulate error."""
+    from sentence_transformers.models import Pooling
+
+    for module in model:
+        if isinstance(module, Pooling):
+            def forward(features, _forward=module.forward):
+                features["token_embeddings"] = features["token_embeddings"].float()
+                return _forward(features)
+            module.forward = forward
+
+
+def _load_model(model_name: str, device: str):
+    """Load (once per process) and prepare a SentenceTransformer for ``device``."""
+    key = (model_name, device)
+    if key in _MODELS:
+        return _MODELS[key]
+
+    from sentence_transformers import SentenceTransformer
+    torch = _torch()
+
+    print(f"  Loading model {model_name} on device: {device}")
+    model = SentenceTransformer(model_name, device=device)
+    # Reduced-precision weights: bf16 where the GPU supports it, fp16 on MPS (bf16 support is partial)
+    if device == "cuda" and torch.cuda.is_bf16_supported():
+        model.to(torch.bfloat16)
+        _upcast_pooling(model)
+    elif device == "mps":
+        model.half()
+        _upcast_pooling(model)
+    if device == "cuda":
+        # Length-sorted batching gives nearly every batch a new (batch, seq_len) shape, so compile one
+        # shape-generic graph; CUDA graphs (mode="reduce-overhead") would re-record for each shape
+        transformer = model[0]
+        transformer.auto_model = torch.compile(transformer.auto_model, dynamic=True, fullgraph=False)
+
+    _MODELS[key] = model
+    return model
+
+
 class LocalEmbedder:
     def __init__(self, model_name: str, batch_size: int):
-        from sentence_transformers import SentenceTransformer
-        import torch
+        torch = _torch()
 
         if torch.backends.mps.is_available():
             device = "mps"
@@ -75,17 +352,229 @@ class LocalEmbedder:
         else:
             device = "cpu"
 
-        print(f"  Loading model {model_name} on device: {device}")
-        self.model = SentenceTransformer(model_name, device=device)
+        if device == "cpu":
+            # Containers often default to a single intra-op thread
+            torch.set_num_threads(os.cpu_count() or 4)
+            try:
+                torch.set_num_interop_threads(2)
+            except RuntimeError:
+                pass  # Only settable before any inter-op work has started
+            torch.backends.mkldnn.enabled = True
+
+        self.model = _load_model(model_name, device)
         self.batch_size = batch_size
         self.device = device
-
-    def encode(self, texts: list[str]) -> list[list[float]]:
-        import torch
-        embeddings = self.model.encode(texts, batch_size=self.batch_size, show_progress_bar=False, convert_to_numpy=True)
+        self._cache: dict[bytes, np.ndarray] = {}
+        # Effective batch size, lowered on CUDA OOM and raised again after a run of successes
+        self._batch_limit = batch_size
+        self._good_bs_streak = 0
+
+        if device == "cuda":
+            # Compile before anything is timed. Two rows of different lengths, because batch
+            # and sequence sizes of 1 get their own specialized graph.
+            self.encode(["warm-up", "warm-up " * 16])
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        return _cached_encode(self._cache, texts, self._encode)
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        torch = _torch()
+        # Tokenize everything in one (Rust, GIL-free) call, then pad per batch
+        encoded = self.model.tokenizer(
+            texts, padding=False, truncation=True, max_length=self.model.max_seq_length, return_tensors=None
+        )
+        features = [{key: values[i] for key, values in encoded.items()} for i in range(len(texts))]
+        def run(map_batches):
+            return _smart_batch(
+                features, self.batch_size, self._encode_batch, map_batches, length=lambda f: len(f["input_ids"])
+            )
+
+        if self.device == "cuda":
+            try:
+                vectors = run(self._prefetch_map)
+            except torch.cuda.OutOfMemoryError:
+                torch.cuda.empty_cache()
+                print("  CUDA OOM in prefetch pipeline; falling back to sequential batches")
+                vectors = run(map)
+        else:
+            vectors = run(map)
         if self.device == "mps":
             torch.mps.synchronize()
-        return embeddings.tolist()
+        return vectors
+
+    def _encode_batch(self, batch: list[dict]) -> np.ndarray:
+        """Embed one window, splitting it into smaller batches while the GPU is out of memory."""
+        torch = _torch()
+        parts = []
+        start = 0
+        while start < len(batch):
+            size = min(self._batch_limit, len(batch) - start)
+            try:
+                parts.append(self._embed_padded(batch[start : start + size]))
+            except torch.cuda.OutOfMemoryError:
+                if size == 1:
+                    raise
+                self._shrink_batch_limit(size)
+                continue
+            start += size
+            self._grow_batch_limit()
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def _shrink_batch_limit(self, size: int) -> None:
+        """Halve the effective batch size after a CUDA OOM at ``size``."""
+        _torch().cuda.empty_cache()
+        self._batch_limit = max(1, size // 2)
+        self._good_bs_streak = 0
+        print(f"  CUDA OOM at batch size {size}; retrying with {self._batch_limit}")
+
+    def _grow_batch_limit(self) -> None:
+        """Count a successful batch and double the limit back toward batch_size after a streak."""
+        self._good_bs_streak += 1
+        if self._good_bs_streak > 8 and self._batch_limit < self.batch_size:
+            self._batch_limit = min(self.batch_size, self._batch_limit * 2)
+            self._good_bs_streak = 0
+            print(f"  Raising batch size back to {self._batch_limit}")
+
+    def _embed_padded(self, batch: list[dict]) -> np.ndarray:
+        padded = self.model.tokenizer.pad(batch, return_tensors="pt")
+        padded = {key: tensor.to(self.device) for key, tensor in padded.items()}
+        return self._forward(padded).float().cpu().numpy()
+
+    def _forward(self, padded: dict):
+        torch = _torch()
+        with torch.inference_mode():
+            # Runs the model's own module stack (transformer -> pooling -> normalize)
+            return self.model(padded)["sentence_embedding"]
+
+    def _prefetch_map(self, _embed_batch, batches: list[list[dict]]) -> list[np.ndarray]:
+        """CUDA pipeline: copy piece k+1 from pinned memory on a side stream while piece k computes.
+
+        Windows are cut into pieces of at most ``_batch_limit`` rows. When a
+        piece's upload or forward pass runs out of memory, the limit is halved
+        from that piece's size and it is re-cut from where it started, so the
+        same adaptive batch size as ``_encode_batch`` applies here; finished
+        pieces are kept. Results stay on the GPU until every piece has been
+        queued, so the host only synchronizes once at the end.
+        """
+        torch = _torch()
+        copy_stream = torch.cuda.Stream()
+        compute_stream = torch.cuda.current_stream()
+        outputs = [[] for _ in batches]
+        cursor = [0, 0]  # window index, offset of the next uncut row in it
+
+        def take():
+            """Cut the next (window, start, size) piece at the current limit, or None when done."""
+            w, start = cursor
+            while w < len(batches) and start >= len(batches[w]):
+                w, start = w + 1, 0
+            if w == len(batches):
+                return None
+            size = min(self._batch_limit, len(batches[w]) - start)
+            cursor[:] = [w, start + size]
+            return w, start, size
+
+        def upload(piece):
+            w, start, size = piece
+            padded = self.model.tokenizer.pad(batches[w][start : start + size], return_tensors="pt")
+            with torch.cuda.stream(copy_stream):
+                return piece, {key: tensor.pin_memory().to(self.device, non_blocking=True) for key, tensor in padded.items()}
+
+        def requeue(piece):
+            """Put ``piece`` (and everything after it) back to be cut again at the current limit."""
+            cursor[:] = piece[:2]
+
+        ahead = None  # (piece, tensors) already uploaded for the next step
+        while (piece := ahead[0] if ahead else take()) is not None:
+            try:
+                _, current = ahead or upload(piece)
+            except torch.cuda.OutOfMemoryError:
+                if piece[2] == 1:
+                    raise
+                ahead = None
+                requeue(piece)
+                self._shrink_batch_limit(piece[2])
+                continue
+            ahead = None
+            compute_stream.wait_stream(copy_stream)
+            for tensor in current.values():
+                tensor.record_stream(compute_stream)  # Allocated on copy_stream, consumed here
+
+            if (following := take()) is not None:
+                try:
+                    ahead = upload(following)
+                except torch.cuda.OutOfMemoryError:
+                    # Only the look-ahead failed: run this piece, then upload that one again without overlap
+                    requeue(following)
+                    if following[2] > 1:
+                        self._shrink_batch_limit(following[2])
+                    else:
+                        torch.cuda.empty_cache()
+
+            try:
+                outputs[piece[0]].append(self._forward(current))
+            except torch.cuda.OutOfMemoryError:
+                if piece[2] == 1:
+                    raise
+                # The look-ahead comes after this piece, so it is dropped and re-cut along with it
+                ahead = None
+                requeue(piece)
+                self._shrink_batch_limit(piece[2])
+                continue
+            self._grow_batch_limit()
+        return [torch.cat(parts).float().cpu().numpy() for parts in outputs]
+
+    def ping(self) -> bool:
+        return True  # Always available once loaded
+
+
+class OnnxEmbedder:
+    """Mean-pooled sentence embeddings from an ONNX export of the model.
+
+    Export once with e.g.
+    ``optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 onnx/``
+    and set ONNX_MODEL_PATH=onnx/model.onnx.
+    """
+
+    PROVIDERS = ("TensorrtExecutionProvider", "CUDAExecutionProvider", "CoreMLExecutionProvider", "CPUExecutionProvider")
+
+    def __init__(self, model_path: str, model_name: str, batch_size: int, max_length: int = 256):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        available = ort.get_available_providers()
+        providers = [p for p in self.PROVIDERS if p in available]
+        print(f"  Loading ONNX model {model_path} with providers: {providers}")
+        self.session = ort.InferenceSession(model_path, providers=providers)
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        repo_id = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        self.tokenizer = Tokenizer.from_pretrained(repo_id)
+        self.tokenizer.enable_padding()
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.batch_size = batch_size
+        self._cache: dict[bytes, np.ndarray] = {}
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        return _cached_encode(self._cache, texts, self._encode)
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        return _smart_batch(texts, self.batch_size, self._encode_batch)
+
+    def _encode_batch(self, batch: list[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(batch)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": attention_mask,
+        }
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+        token_embeddings = self.session.run(None, feeds)[0]
+
+        mask = attention_mask[..., None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return pooled
 
     def ping(self) -> bool:
         return True  # Always available once loaded
@@ -115,8 +604,8 @@ def test_embeddings(embedder) -> bool:
     vectors = embedder.encode(test_texts)
 
     print(f"  Received {len(vectors)} vectors")
-    if vectors:
-        print(f"  Vector dimension: {len(vectors[0])}")
+    if len(vectors):
+        print(f"  Vector dimension: {vectors.shape[1]}")
         print(f"  First vector (truncated): {vectors[0][:5]}...")
 
     return len(vectors) == len(test_texts)
@@ -141,19 +630,25 @@ def test_full_pipeline(embedder) -> bool:
     sample_doc = "This is a sample document that simulates content from Solr 7. " * 50
 
     print(f"\nFull pipeline test:")
-    chunks = chunk_text(sample_doc, CHUNK_SIZE, CHUNK_OVERLAP)
-    print(f"  Chunked into {len(chunks)} pieces")
+    n_chunks = len(_chunk_starts(len(sample_doc), CHUNK_SIZE, CHUNK_OVERLAP))
+    print(f"  Chunking into {n_chunks} pieces")
 
     import time
     start = time.perf_counter()
-    all_vectors = embedder.encode(chunks)
+    chunks = iter_chunks(sample_doc, CHUNK_SIZE, CHUNK_OVERLAP)
+    if hasattr(embedder, "encode_iter"):
+        # Stream: chunking overlaps with embedding of earlier batches
+        batches = list(embedder.encode_iter(chunks))
+        all_vectors = np.concatenate(batches) if batches else np.empty((0, 0), dtype=np.float32)
+    else:
+        all_vectors = embedder.encode(list(chunks))
     elapsed = time.perf_counter() - start
 
     print(f"  Generated {len(all_vectors)} embeddings in {elapsed:.2f}s")
-    print(f"  Vector dimension: {len(all_vectors[0]) if all_vectors else 'N/A'}")
-    print(f"  Throughput: {len(chunks) / elapsed:.0f} chunks/sec")
+    print(f"  Vector dimension: {all_vectors.shape[1] if len(all_vectors) else 'N/A'}")
+    print(f"  Throughput: {n_chunks / elapsed:.0f} chunks/sec")
 
-    return len(all_vectors) == len(chunks)
+    return len(all_vectors) == n_chunks
 
 
 def test_large_batch(embedder) -> bool:
@@ -177,25 +672,42 @@ def test_large_batch(embedder) -> bool:
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Test embedding pipeline")
     parser.add_argument("--local", action="store_true", help="Use local sentence-transformers instead of DJL")
+    parser.add_argument("--onnx", action="store_true", help="Use an ONNX export (ONNX_MODEL_PATH) via onnxruntime")
+    parser.add_argument("--async", dest="async_djl", action="store_true", help="Use the asyncio (aiohttp) DJL client")
+    parser.add_argument("--gzip", action="store_true", help="Gzip large DJL request bodies (endpoint must accept it)")
     args = parser.parse_args()
 
+    if args.onnx:
+        mode = f"ONNX ({ONNX_MODEL_PATH})"
+    elif args.local:
+        mode = "LOCAL (sentence-transformers)"
+    elif args.async_djl:
+        mode = "DJL container (async)"
+    else:
+        mode = "DJL container"
+
     print("=" * 50)
     print("Embed Pipeline - Local Tests")
-    print(f"Mode: {'LOCAL (sentence-transformers)' if args.local else 'DJL container'}")
+    print(f"Mode: {mode}")
     print("=" * 50)
 
     # Create embedder
-    if args.local:
+    if args.onnx:
+        embedder = OnnxEmbedder(ONNX_MODEL_PATH, MODEL_NAME, BATCH_SIZE)
+    elif args.local:
         embedder = LocalEmbedder(MODEL_NAME, BATCH_SIZE)
     else:
         if not DJL_URL:
             print("\nERROR: DJL_URL not set. Use --local or set DJL_URL in config.env")
             exit(1)
         print(f"DJL URL: {DJL_URL}")
-        embedder = DJLEmbedder(DJL_URL, BATCH_SIZE)
+        if args.async_djl:
+            embedder = AsyncDJLEmbedder(DJL_URL, BATCH_SIZE, gzip_requests=args.gzip)
+        else:
+            embedder = DJLEmbedder(DJL_URL, BATCH_SIZE, gzip_requests=args.gzip)
 
     if not test_connection(embedder):
-        if args.local:
+        if args.local or args.onnx:
             print("\nLocal embedder failed to initialize")
         else:
             print("\nDJL not available. Start it with: docker-compose up -d")
@@ -14,7 +14,7 @@ from standalone_text_generator import (
     BankProfile, BusinessModel, CAMELSExamination,
     ExaminationFinding, RiskArea, FindingType, Severity,
     generate_supervisory_letter, generate_camels_summary,
-    generate_lfbo_rating_letter, ExamHistorySnapshot
+    generate_lfbo_rating_letter, ExamHistorySnapshot, save_documents
 )
 
 
@@ -124,11 +124,9 @@ def generate_random_examination(bank: BankProfile) -> CAMELSExamination:
             ExamHistorySnapshot(
                 exam_date=datetime(prior_year, random.randint(1, 12), random.randint(1, 28)),
                 composite_rating=random.choice([1, 2, 2, 3, 3, 4]),
-                component_ratings={
-                    'capital': random.choice([1, 2, 2, 3]),
-                    'liquidity': random.choice([1, 2, 2, 3]),
-                    'management': random.choice([1, 2, 2, 3]),
-                },
+                capital_rating=random.choice([1, 2, 2, 3]),
+                liquidity_rating=random.choice([1, 2, 2, 3]),
+                management_rating=random.choice([1, 2, 2, 3]),
                 tier1_leverage=round(random.uniform(7.0, 12.0), 2),
                 total_rbc=round(random.uniform(10.0, 18.0), 2),
                 npa_ratio=round(random.uniform(0.5, 3.0), 2),
@@ -185,6 +183,7 @@ def generate_batch(output_dir: Path, count: int, doc_type: str = "all"):
             doc_types = [doc_type]
 
         # Generate selected document types
+        documents = []
         for dtype in doc_types:
             if dtype == "supervisory":
                 content = generate_supervisory_letter(examination, examination.findings)
@@ -196,8 +195,10 @@ def generate_batch(output_dir: Path, count: int, doc_type: str = "all"):
                 content = generate_lfbo_rating_letter(examination)
                 filename = output_dir / f"doc{i:06d}_lfbo_{bank.rssd}.txt"
 
-            with open(filename, 'w') as f:
-                f.write(content)
+            documents.append((filename, content))
+
+        # Encode once and write the raw bytes (no text or buffer layers)
+        save_documents(documents)
 
         # Progress indicator
         if (i + 1) % 100 == 0:
@@ -5,9 +5,10 @@ This module can be copied to any Python project with zero external dependencies.
 Generates realistic supervisory letters, CAMELS summaries, and LFBO rating letters.
 
 Usage:
-    from standalone_text_generator import generate_example_documents
+    from standalone_text_generator import generate_example_documents, set_seed
 
-    # Generate all three document types
+    # Generate all three document types (optionally reproducible)
+    set_seed(42)
     supervisory_letter, camels_summary, lfbo_letter = generate_example_documents()
 
     # Save to files
@@ -18,28 +19,37 @@ Requirements: Python 3.7+
 No external dependencies required!
 """
 
+import heapq
+import io
+import os
 import random
+import sys
+import threading
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional
+from string import Formatter
+from types import MappingProxyType
+from typing import Callable, Iterator, List, Dict, Mapping, Tuple, Optional, Union
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 
 
 # ============================================================================
 # CONSTANTS
 # ============================================================================
 
-CITATIONS_BY_RISK = {
-    "Liquidity Risk Management": "SR 10-6 (Liquidity Risk Management); 12 CFR 252 Subpart F",
-    "Credit Risk Management": "SR 07-1 (Interagency Guidance on Concentrations in CRE); 12 CFR 365",
-    "Interest Rate Risk": "SR 12-7 (Stress Testing); 12 CFR 324 Appendix D",
-    "Operational Risk": "SR 15-9 (Cybersecurity Assessment); FFIEC IT Handbook",
-    "Information Security": "SR 11-9 (Information Security), FFIEC CAT",
-    "BSA/AML Compliance": "BSA (31 CFR Chapter X); FFIEC BSA/AML Manual",
-    "Compliance Risk": "Consumer compliance regulations as applicable (Reg Z/CC/E)",
-    "Vendor Management": "SR 13-19 / CA 13-21 (Third-Party Risk Management)",
-    "Capital Planning": "SR 15-18 / SR 15-19 (Capital Planning and Stress Testing)"
-}
+# Section banner used throughout the generated documents
+SEP80 = "=" * 80
+
+COMPONENT_KEYS = ("capital", "asset_quality", "management", "earnings", "liquidity", "sensitivity")
+
+# Sort/scan key for exam history (C-level attribute fetch instead of a lambda)
+_EXAM_DATE = attrgetter("exam_date")
 
 RATING_DESCRIPTIONS = {
     1: "Strongly Meets Expectations",
@@ -49,6 +59,105 @@ RATING_DESCRIPTIONS = {
     5: "Deficient-2"
 }
 
+# Lowercase forms used mid-sentence in the LFBO letter
+RATING_DESCRIPTIONS_LOWER = {k: v.lower() for k, v in RATING_DESCRIPTIONS.items()}
+
+
+# CAMELS narrative phrases by component rating (1-5), unpacked once per summary
+def _by_rating(satisfactory: tuple, fair: tuple, weak: tuple) -> Dict[int, tuple]:
+    """Phrase table for components described as rating <= 2 / rating 3 / rating >= 4"""
+    return {1: satisfactory, 2: satisfactory, 3: fair, 4: weak, 5: weak}
+
+
+_CAPITAL_SOUND = ("are adequate", "align with", "diverse", "multiple channels including",
+                  ", equity issuance, and subordinated debt", "incorporates comprehensive stress testing",
+                  "adequately considers")
+_CAPITAL_WEAK = ("require improvement", "do not meet", "limited", "primarily", "",
+                 "requires enhanced stress testing", "does not fully reflect")
+
+# (position, planning, stress, raising, channels, sources, process, considers)
+CAPITAL_PHRASES = {
+    1: ("strong",) + _CAPITAL_SOUND,
+    2: ("adequate",) + _CAPITAL_SOUND,
+    3: ("satisfactory",) + _CAPITAL_WEAK,
+    4: ("weak",) + _CAPITAL_WEAK,
+    5: ("weak",) + _CAPITAL_WEAK,
+}
+
+# (practices, underwriting, concentration, problem_loans, alll_method, alll_factors, alll_level)
+ASSET_QUALITY_PHRASES = _by_rating(
+    ("sound", "strong", "appropriate", "maintains", "comprehensive and well-documented", "appropriate", "adequate"),
+    ("adequate", "acceptable", "elevated", "should enhance", "adequate but requires improvement", "limited",
+     "marginally adequate"),
+    ("weak", "inadequate", "elevated", "should enhance", "deficient", "limited", "insufficient"),
+)
+
+# (oversight, planning, understanding, board_oversight, committees, expertise, judgment, mis, audit)
+MANAGEMENT_PHRASES = _by_rating(
+    ("strong", "appropriate", "strong", "active", "well-functioning", "deep", "demonstrates",
+     "comprehensive and timely", "independent, adequately staffed, and effective"),
+    ("satisfactory", "adequate", "adequate", "satisfactory", "adequately structured", "sufficient",
+     "generally demonstrates", "adequate", "generally adequate but require enhancement"),
+    ("weak", "insufficient", "limited", "insufficient", "ineffective", "limited", "lacks", "insufficient",
+     "deficient and require significant improvement"),
+)
+
+# (level, capacity, nonint, lines, targets, provision, sustainability)
+EARNINGS_PHRASES = _by_rating(
+    ("strong", "solid", "diverse", "multiple", "consistently exceed", "appropriate", "strong"),
+    ("acceptable", "acceptable", "limited", "few", "generally meet", "generally adequate", "moderate"),
+    ("weak", "weak", "limited", "few", "fall short of", "insufficient", "uncertain"),
+)
+
+# (processes, stress, funding, position, unencumbered, deposits, volatility)
+LIQUIDITY_PHRASES = _by_rating(
+    ("comprehensive", "robust", "diverse", "strong", "substantial", "stable", "does not present"),
+    ("satisfactory", "adequate", "adequate", "satisfactory", "adequate", "moderate", "moderately increases"),
+    ("deficient", "weak", "concentrated", "tight", "limited", "elevated", "significantly increases"),
+)
+
+# (irr, measurement, hedging, alm, position, exposure)
+SENSITIVITY_PHRASES = _by_rating(
+    ("well-managed", "comprehensive", "effective", "effectively identify and control", "conservative",
+     "well-protected"),
+    ("adequately managed", "satisfactory", "adequate", "adequately monitor", "moderate", "moderately exposed"),
+    ("poorly managed", "weak", "insufficient", "do not adequately address", "elevated", "significantly vulnerable"),
+)
+
+# ============================================================================
+# RANDOM NUMBER GENERATION
+# ============================================================================
+
+# Dedicated generators so document generation does not share (or disturb) the
+# global ``random`` state of the host project. Each thread gets its own
+# generator, so parallel workers draw independently without sharing state.
+_local = threading.local()
+
+
+def _default_rng() -> random.Random:
+    """Generator for the current thread, created on first use"""
+    try:
+        return _local.rng
+    except AttributeError:
+        rng = _local.rng = random.Random()
+        return rng
+
+
+def set_seed(seed: Optional[int]) -> None:
+    """Reseed the current thread's generator (None for OS entropy)"""
+    _default_rng().seed(seed)
+
+
+@contextmanager
+def with_seed(seed: Optional[int]) -> Iterator[random.Random]:
+    """Use a freshly seeded generator in the current thread for the duration of the block"""
+    previous = _default_rng()
+    rng = _local.rng = random.Random(seed)
+    try:
+        yield rng
+    finally:
+        _local.rng = previous
+
 
 # ============================================================================
 # ENUMS
@@ -93,24 +202,288 @@ class BusinessModel(Enum):
     SPECIALTY = "Specialty Finance"
 
 
+CITATIONS_BY_RISK = {
+    RiskArea.LIQUIDITY_RISK: "SR 10-6 (Liquidity Risk Management); 12 CFR 252 Subpart F",
+    RiskArea.CREDIT_RISK: "SR 07-1 (Interagency Guidance on Concentrations in CRE); 12 CFR 365",
+    RiskArea.INTEREST_RATE_RISK: "SR 12-7 (Stress Testing); 12 CFR 324 Appendix D",
+    RiskArea.OPERATIONAL_RISK: "SR 15-9 (Cybersecurity Assessment); FFIEC IT Handbook",
+    RiskArea.IT_SECURITY: "SR 11-9 (Information Security), FFIEC CAT",
+    RiskArea.BSA_AML: "BSA (31 CFR Chapter X); FFIEC BSA/AML Manual",
+    RiskArea.COMPLIANCE_RISK: "Consumer compliance regulations as applicable (Reg Z/CC/E)",
+    RiskArea.VENDOR_MANAGEMENT: "SR 13-19 / CA 13-21 (Third-Party Risk Management)",
+    RiskArea.CAPITAL_PLANNING: "SR 15-18 / SR 15-19 (Capital Planning and Stress Testing)"
+}
+
+# Display labels by member, skipping the enum ``.value`` descriptor in hot loops
+_RA_VALUE = {ra: ra.value for ra in RiskArea}
+_RA_LOWER = {ra: label.lower() for ra, label in _RA_VALUE.items()}
+_FT_VALUE = {ft: ft.value for ft in FindingType}
+_SEV_VALUE = {sev: sev.value for sev in Severity}
+
+_DEFAULT_CITATION = "Applicable supervisory guidance and CFR references"
+
+# Every risk area resolved up front, so findings index it without a fallback
+_CITATIONS_BY_RISK_ENUM = {ra: CITATIONS_BY_RISK.get(ra, _DEFAULT_CITATION) for ra in RiskArea}
+
+
+# ============================================================================
+# METRIC GENERATORS
+# ============================================================================
+# Pure numeric kernels taking primitive arguments and a pre-drawn noise value,
+# so the same arithmetic can be driven per instance or over many banks at once.
+
+# Base NPA ratio / ROA indexed directly by component rating (1-5)
+_BASE_NPA = (None, 0.3, 0.8, 2.0, 4.5, 8.0)
+_BASE_ROA = (None, 1.4, 1.1, 0.7, 0.3, -0.5)
+
+def _round2(value: float) -> float:
+    """Round to 2 decimals via integer rounding (cheaper than round(value, 2))"""
+    return round(value * 100.0) / 100.0
+
+
+def _capital_ratio(capital_rating: int, total_assets: float, noise: float) -> float:
+    """Tier 1 leverage ratio from capital rating, asset size and noise in [-1, 1]"""
+    base = 8.0
+    rating_adjustment = (3 - capital_rating) * 1.5
+    size_adjustment = 2.0 if total_assets > 10000 else 0.0
+    return _round2(base + rating_adjustment + size_adjustment + noise)
+
+
+def _npa_ratio(asset_quality_rating: int, noise: float) -> float:
+    """NPA ratio from asset quality rating and a multiplicative noise factor"""
+    return _round2(_BASE_NPA[asset_quality_rating] * noise)
+
+
+def _roa(earnings_rating: int, noise: float) -> float:
+    """ROA from earnings rating and a multiplicative noise factor"""
+    return _round2(_BASE_ROA[earnings_rating] * noise)
+
+
+# ============================================================================
+# FINDING TEMPLATES
+# ============================================================================
+
+def _compile_template(template: str) -> Callable[[Dict[str, object]], str]:
+    """
+    Pre-tokenize a str.format template into (literal, field) pairs.
+
+    The returned callable renders the template from a dict of values without
+    re-parsing the format string on every call. Only plain ``{name}`` fields
+    are supported.
+    """
+    tokens = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported field in template: {{{field_name}}}")
+        tokens.append((literal, field_name))
+
+    def render(values: Dict[str, object]) -> str:
+        return "".join([
+            literal if field_name is None else literal + str(values[field_name])
+            for literal, field_name in tokens
+        ])
+
+    return render
+
+
+_TITLE_TEMPLATES: Mapping[RiskArea, Tuple[str, ...]] = MappingProxyType({
+    RiskArea.CREDIT_RISK: (
+        "Deficiencies in Credit Risk Management",
+        "Inadequate Loan Review Function",
+        "Weaknesses in Underwriting Standards",
+    ),
+    RiskArea.LIQUIDITY_RISK: (
+        "Inadequate Liquidity Stress Testing",
+        "Weaknesses in Contingency Funding Plan",
+        "Deficiencies in Funds Management",
+    ),
+    RiskArea.BSA_AML: (
+        "BSA/AML Compliance Deficiencies",
+        "Inadequate Customer Due Diligence",
+        "Suspicious Activity Monitoring Weaknesses",
+    ),
+})
+
+_IMPACT_TEMPLATES: Mapping[Severity, str] = MappingProxyType({
+    Severity.LOW: "These deficiencies present moderate risk to the Bank's safety and soundness if not addressed.",
+    Severity.MODERATE: "These deficiencies present elevated risk to the Bank and could adversely impact financial condition if left unaddressed.",
+    Severity.HIGH: "These deficiencies present significant risk to the Bank's safety and soundness and require prompt corrective action.",
+    Severity.CRITICAL: "These deficiencies pose an immediate threat to the Bank's viability and must be addressed without delay."
+})
+
+_DESCRIPTION_TEMPLATES: Mapping[RiskArea, str] = MappingProxyType({
+    RiskArea.CREDIT_RISK: """During the examination, we identified deficiencies in the Bank's credit risk management processes.
+Specifically, the Bank's loan review function lacks independence and adequate staffing to effectively
+identify emerging credit quality issues. Our sample review revealed {issue_count} loans totaling ${loan_amount}M
+that were inadequately risk-rated, with {pct}% requiring downgrade to classified status.
+
+The examination team conducted a comprehensive review of the Bank's lending portfolio, including commercial real estate,
+commercial and industrial, and consumer loans. We analyzed {sample_size} loan relationships representing approximately
+{sample_pct}% of the total loan portfolio. Our analysis revealed systematic weaknesses in the loan origination process,
+particularly in the areas of financial statement analysis, collateral valuation, and covenant monitoring.
+
+Furthermore, the Bank's credit policy lacks specific guidance on acceptable debt service coverage ratios, loan-to-value limits,
+and industry concentration thresholds. The credit administration function does not have adequate systems to track and report
+credit exceptions, resulting in {exception_count} instances where loans were approved outside of established credit parameters
+without proper exception documentation or board approval. These weaknesses increase the Bank's exposure to credit losses and
+diminish the Board's ability to provide effective oversight of credit risk.""",
+
+    RiskArea.LIQUIDITY_RISK: """The Bank's liquidity risk management framework has material weaknesses.
+Internal liquidity stress testing does not adequately capture the Bank's funding vulnerabilities,
+particularly related to the concentration of uninsured deposits ({pct}% of total deposits). The Bank's
+contingency funding plan has not been updated since {year} and does not reflect current balance sheet composition.
+
+Our examination included a thorough review of the Bank's asset-liability management practices, funding strategies, and
+liquidity risk monitoring systems. We identified significant concerns regarding the Bank's reliance on volatile funding sources,
+including brokered deposits totaling ${broker_deposits}M ({broker_pct}% of total deposits) and borrowings from the Federal
+Home Loan Bank of ${fhlb_amount}M. The Bank's internal liquidity stress scenarios do not adequately consider the potential
+for concurrent deposit outflows and reduced borrowing capacity during stressed conditions.
+
+Additionally, the Bank's liquidity buffer consists primarily of investment securities with embedded interest rate risk,
+and the contingent borrowing capacity has not been validated through test transactions in over {months} months. The funds
+management committee meets only quarterly, which is insufficient given the current volatility in funding markets and the
+Bank's aggressive growth strategy. Management information systems do not provide real-time visibility into deposit flows
+or concentration metrics, limiting the Bank's ability to respond quickly to emerging liquidity pressures.""",
+
+    RiskArea.BSA_AML: """The Bank's BSA/AML compliance program has material deficiencies. Customer due
+diligence procedures are inadequate for {pct}% of higher-risk customer relationships reviewed. The suspicious
+activity monitoring system generated {issue_count} alerts that were inadequately investigated.
+
+The examination included a comprehensive review of the Bank's BSA/AML compliance program, including customer due diligence,
+suspicious activity monitoring, currency transaction reporting, and OFAC compliance. We identified systemic deficiencies in
+the Bank's ability to identify, monitor, and report potentially suspicious activity. The Bank processed {alert_count} alerts
+during the review period, but only filed {sar_count} Suspicious Activity Reports, raising concerns about the adequacy of
+alert disposition and investigation processes.
+
+The Bank's customer risk rating methodology does not adequately consider all relevant risk factors, including geographic risk,
+product/service risk, and customer behavior. We identified {high_risk_count} high-risk customer relationships that lacked
+enhanced due diligence documentation, including {pep_count} politically exposed persons and {msb_count} money service businesses.
+Transaction monitoring scenarios have not been validated or tuned in over {validation_months} months, and several scenarios
+are generating excessive false positive alerts without proper management review or optimization.
+
+Additionally, the BSA Officer position has experienced {turnover_count} turnovers in the past {turnover_years} years, and
+current BSA staffing levels are inadequate given the Bank's risk profile and transaction volumes. Independent testing of the
+BSA/AML program identified {testing_issues} issues in the prior examination cycle, and management has not fully addressed
+these deficiencies. The Board receives limited information regarding BSA/AML compliance, and board members demonstrated
+limited understanding of the Bank's BSA/AML risk exposure during examination interviews.""",
+})
+
+_DEFAULT_DESCRIPTION = """Examiners identified deficiencies in the Bank's {risk_area} framework. During our review, we noted
+{issue_count} instances where the Bank's practices did not meet supervisory expectations.
+
+Our examination included a detailed assessment of the Bank's policies, procedures, and operational controls related to
+{risk_area}. We reviewed {sample_size} transactions and activities, interviewed key personnel, and analyzed management
+reporting systems. The examination revealed gaps in risk identification, measurement, monitoring, and control processes.
+
+Specific deficiencies include inadequate board and senior management oversight, insufficient staffing and expertise,
+outdated or incomplete policies and procedures, and management information systems that do not provide timely and accurate
+risk reporting. These weaknesses limit the Bank's ability to effectively manage {risk_area} and increase the potential for
+operational losses, regulatory sanctions, and reputational damage."""
+
+_DESC_TEMPLATES: Mapping[RiskArea, Callable[[Dict[str, object]], str]] = MappingProxyType({
+    risk_area: _compile_template(template) for risk_area, template in _DESCRIPTION_TEMPLATES.items()
+})
+_DEFAULT_DESC = _compile_template(_DEFAULT_DESCRIPTION)
+
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+# Slotted instances (smaller, faster attribute access) where dataclasses support
+# it; hand-written __slots__ would clash with field defaults on 3.7-3.9.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Every "First Last" examiner name, so picking one is a single draw
+_EXAMINER_NAMES = tuple(
+    f"{first} {last}"
+    for first in ("James", "Mary", "John", "Patricia", "Robert", "Jennifer")
+    for last in ("Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia")
+)
+
+LONG_DATE = '%B %d, %Y'
+SHORT_DATE = '%m/%d/%Y'
+
+
+def _date_text(name: str, fmt: str) -> property:
+    """Read-only ``strftime`` of date field ``name``, cached until the field is reassigned"""
+    key = (name, fmt)
+
+    def fget(self) -> str:
+        value = getattr(self, name)
+        cached = self._date_strings.get(key)
+        if cached is None or cached[0] is not value:
+            cached = self._date_strings[key] = (value, value.strftime(fmt))
+        return cached[1]
+
+    return property(fget)
+
+
+@dataclass(**_SLOTS)
 class ExamHistorySnapshot:
     """Historical snapshot of a prior examination"""
     exam_date: datetime
     composite_rating: int
-    component_ratings: Dict[str, int]
     tier1_leverage: float
     total_rbc: float
     npa_ratio: float
     roa: float
     loan_to_deposit: float
 
+    # Component ratings (0 = not rated in this examination)
+    capital_rating: int = 0
+    asset_quality_rating: int = 0
+    management_rating: int = 0
+    earnings_rating: int = 0
+    liquidity_rating: int = 0
+    sensitivity_rating: int = 0
+
+    # Formatted on access rather than cached: each is read about once per letter,
+    # and a per-snapshot cache would outweigh the flat fields above
+    @property
+    def exam_date_long(self) -> str:
+        """Exam date as e.g. 'March 05, 2023'"""
+        return self.exam_date.strftime(LONG_DATE)
+
+    @property
+    def exam_date_short(self) -> str:
+        """Exam date as e.g. '03/05/2023'"""
+        return self.exam_date.strftime(SHORT_DATE)
+
+    @property
+    def component_ratings(self) -> Dict[str, int]:
+        """Rated components keyed by name, e.g. {'capital': 2, 'liquidity': 3}"""
+        return {
+            key: rating
+            for key, rating in zip(COMPONENT_KEYS, self.rating_tuple())
+            if rating
+        }
+
+    def component_rating(self, key: str) -> int:
+        """Rating for a component, falling back to the composite when not rated"""
+        return getattr(self, key + "_rating") or self.composite_rating
+
+    def rating_tuple(self) -> Tuple[int, int, int, int, int, int]:
+        """Component ratings in CAMELS order"""
+        return (
+            self.capital_rating,
+            self.asset_quality_rating,
+            self.management_rating,
+            self.earnings_rating,
+            self.liquidity_rating,
+            self.sensitivity_rating,
+        )
+
+    @classmethod
+    def ratings_matrix(cls, snapshots: List["ExamHistorySnapshot"]) -> array:
+        """Row-major (N, 6) int8 matrix of component ratings for batch analysis"""
+        matrix = array("b")
+        for snapshot in snapshots:
+            matrix.extend(snapshot.rating_tuple())
+        return matrix
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class BankProfile:
     """Represents a synthetic bank with realistic characteristics"""
     name: str
@@ -140,46 +513,91 @@ class BankProfile:
     sensitivity_rating: int = 2
     prior_examinations: List[ExamHistorySnapshot] = field(default_factory=list)
 
+    # Generator for synthetic values (defaults to the current thread's generator)
+    rng: Optional[random.Random] = field(default=None, repr=False, compare=False)
+
+    # (source values, display strings) backing ``formatted``
+    _formatted: Optional[Tuple[tuple, Dict[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Generate realistic financial metrics based on asset size and ratings"""
+        rng = self.rng or _default_rng()
         if self.tier1_leverage == 0.0:
             self.tier1_leverage = self._generate_capital_ratio()
         if self.total_rbc == 0.0:
-            self.total_rbc = round(self.tier1_leverage * random.uniform(1.3, 1.8), 2)
+            self.total_rbc = _round2(self.tier1_leverage * rng.uniform(1.3, 1.8))
         if self.npa_ratio == 0.0:
             self.npa_ratio = self._generate_npa_ratio()
         if self.roa == 0.0:
             self.roa = self._generate_roa()
         if self.roe == 0.0:
-            self.roe = round(self.roa * random.uniform(8, 12), 2)
+            self.roe = _round2(self.roa * rng.uniform(8, 12))
         if self.nim == 0.0:
-            self.nim = round(random.uniform(2.5, 4.5), 2)
+            self.nim = _round2(rng.uniform(2.5, 4.5))
         if self.efficiency_ratio == 0.0:
-            self.efficiency_ratio = round(random.uniform(50, 75), 2)
+            self.efficiency_ratio = _round2(rng.uniform(50, 75))
         if self.loan_to_deposit == 0.0:
-            self.loan_to_deposit = round(random.uniform(70, 95), 2)
+            self.loan_to_deposit = _round2(rng.uniform(70, 95))
+
+    @property
+    def formatted(self) -> Dict[str, str]:
+        """Display strings for the metrics the documents print, formatted once per value set"""
+        key = (self.total_assets, self.tier1_leverage, self.total_rbc, self.npa_ratio, self.roa,
+               self.loan_to_deposit)
+        if self._formatted is None or self._formatted[0] != key:
+            total_assets, tier1_leverage, total_rbc, npa_ratio, roa, loan_to_deposit = key
+            self._formatted = (key, {
+                "assets_m": f"{total_assets:,.1f}",
+                "tier1": f"{tier1_leverage:.1f}",
+                "rbc": f"{total_rbc:.1f}",
+                "npa": f"{npa_ratio:.1f}",
+                "roa": f"{roa:.2f}",
+                "ltd": f"{loan_to_deposit:.1f}",
+            })
+        return self._formatted[1]
 
     def _generate_capital_ratio(self) -> float:
         """Generate realistic capital ratios based on size and rating"""
-        base = 8.0
-        rating_adjustment = (3 - self.capital_rating) * 1.5
-        size_adjustment = 2.0 if self.total_assets > 10000 else 0.0
-        return round(base + rating_adjustment + size_adjustment + random.uniform(-1, 1), 2)
+        return _capital_ratio(self.capital_rating, self.total_assets, (self.rng or _default_rng()).uniform(-1, 1))
 
     def _generate_npa_ratio(self) -> float:
         """Generate NPA ratio based on asset quality rating"""
-        base_npa = {1: 0.3, 2: 0.8, 3: 2.0, 4: 4.5, 5: 8.0}
-        return round(base_npa[self.asset_quality_rating] * random.uniform(0.7, 1.3), 2)
+        return _npa_ratio(self.asset_quality_rating, (self.rng or _default_rng()).uniform(0.7, 1.3))
 
     def _generate_roa(self) -> float:
         """Generate ROA based on earnings rating"""
-        base_roa = {1: 1.4, 2: 1.1, 3: 0.7, 4: 0.3, 5: -0.5}
-        return round(base_roa[self.earnings_rating] * random.uniform(0.8, 1.2), 2)
+        return _roa(self.earnings_rating, (self.rng or _default_rng()).uniform(0.8, 1.2))
+
 
+def _lazy_text(name: str) -> property:
+    """Text field generated by ``_generate_<name>`` on first access and cached"""
+    attr = "_" + name
+    generate = "_generate_" + name
 
-@dataclass
+    def fget(self) -> str:
+        value = getattr(self, attr)
+        if not value:
+            value = getattr(self, generate)()
+            setattr(self, attr, value)
+        return value
+
+    def fset(self, value: str) -> None:
+        setattr(self, attr, value)
+
+    return property(fget, fset)
+
+
+@dataclass(**_SLOTS)
 class ExaminationFinding:
-    """Represents a supervisory finding"""
+    """
+    Represents a supervisory finding
+
+    description, impact and required_action are generated lazily on first
+    access, so callers that only need structured metadata (type, severity,
+    title) never pay for the template expansion.
+    """
     risk_area: RiskArea
     finding_type: FindingType
     severity: Severity
@@ -189,210 +607,411 @@ class ExaminationFinding:
     required_action: str = ""
     timeframe_days: int = 180
 
+    # Generator for synthetic values (defaults to the current thread's generator)
+    rng: Optional[random.Random] = field(default=None, repr=False, compare=False)
+
+    # Backing storage for the lazy text properties installed below
+    _description: str = field(init=False, repr=False, compare=False)
+    _impact: str = field(init=False, repr=False, compare=False)
+    _required_action: str = field(init=False, repr=False, compare=False)
+    # Seed for the description draws, so lazy text does not depend on access order
+    _text_seed: int = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Generate finding content based on parameters"""
+        rng = self.rng or _default_rng()
         if not self.title:
             self.title = self._generate_title()
-        if not self.description:
-            self.description = self._generate_description()
-        if not self.impact:
-            self.impact = self._generate_impact()
-        if self.finding_type == FindingType.MRIA:
-            self.timeframe_days = random.choice([15, 30, 45, 60])
+        if self.finding_type is FindingType.MRIA:
+            self.timeframe_days = rng.choice([15, 30, 45, 60])
         else:
-            self.timeframe_days = random.choice([90, 120, 180, 270, 365])
-        if not self.required_action:
-            self.required_action = self._generate_required_action()
+            self.timeframe_days = rng.choice([90, 120, 180, 270, 365])
+        self._text_seed = rng.getrandbits(64)
 
     def _generate_title(self) -> str:
         """Generate finding title"""
-        templates = {
-            RiskArea.CREDIT_RISK: [
-                "Deficiencies in Credit Risk Management",
-                "Inadequate Loan Review Function",
-                "Weaknesses in Underwriting Standards",
-            ],
-            RiskArea.LIQUIDITY_RISK: [
-                "Inadequate Liquidity Stress Testing",
-                "Weaknesses in Contingency Funding Plan",
-                "Deficiencies in Funds Management",
-            ],
-            RiskArea.BSA_AML: [
-                "BSA/AML Compliance Deficiencies",
-                "Inadequate Customer Due Diligence",
-                "Suspicious Activity Monitoring Weaknesses",
-            ],
-        }
-        templates_for_area = templates.get(self.risk_area, ["Deficiencies in " + self.risk_area.value])
-        return random.choice(templates_for_area)
+        templates_for_area = _TITLE_TEMPLATES.get(self.risk_area, ("Deficiencies in " + _RA_VALUE[self.risk_area],))
+        return (self.rng or _default_rng()).choice(templates_for_area)
 
     def _generate_description(self) -> str:
         """Generate detailed finding description"""
-        templates = {
-            RiskArea.CREDIT_RISK: """During the examination, we identified deficiencies in the Bank's credit risk management processes.
-Specifically, the Bank's loan review function lacks independence and adequate staffing to effectively
-identify emerging credit quality issues. Our sample review revealed {issue_count} loans totaling ${loan_amount}M
-that were inadequately risk-rated, with {pct}% requiring downgrade to classified status.
+        rng = random.Random(self._text_seed)
+        randint, uniform = rng.randint, rng.uniform
+        values = {
+            "risk_area": _RA_VALUE[self.risk_area],
+            "issue_count": randint(5, 25),
+            "loan_amount": round(uniform(10, 150), 1),
+            "pct": randint(15, 45),
+            "year": randint(2019, 2023),
+            "sample_size": randint(50, 200),
+            "sample_pct": randint(20, 50),
+            "exception_count": randint(15, 45),
+            "broker_deposits": round(uniform(50, 500), 1),
+            "broker_pct": randint(10, 30),
+            "fhlb_amount": round(uniform(100, 800), 1),
+            "months": randint(12, 36),
+            "alert_count": randint(500, 5000),
+            "sar_count": randint(5, 50),
+            "high_risk_count": randint(20, 80),
+            "pep_count": randint(2, 15),
+            "msb_count": randint(5, 25),
+            "validation_months": randint(18, 48),
+            "turnover_count": randint(2, 5),
+            "turnover_years": randint(2, 4),
+            "testing_issues": randint(8, 20),
+        }
+        return _DESC_TEMPLATES.get(self.risk_area, _DEFAULT_DESC)(values)
 
-The examination team conducted a comprehensive review of the Bank's lending portfolio, including commercial real estate,
-commercial and industrial, and consumer loans. We analyzed {sample_size} loan relationships representing approximately
-{sample_pct}% of the total loan portfolio. Our analysis revealed systematic weaknesses in the loan origination process,
-particularly in the areas of financial statement analysis, collateral valuation, and covenant monitoring.
+    def _generate_impact(self) -> str:
+        """Generate impact statement"""
+        return _IMPACT_TEMPLATES[self.severity]
 
-Furthermore, the Bank's credit policy lacks specific guidance on acceptable debt service coverage ratios, loan-to-value limits,
-and industry concentration thresholds. The credit administration function does not have adequate systems to track and report
-credit exceptions, resulting in {exception_count} instances where loans were approved outside of established credit parameters
-without proper exception documentation or board approval. These weaknesses increase the Bank's exposure to credit losses and
-diminish the Board's ability to provide effective oversight of credit risk.""",
+    def _generate_required_action(self) -> str:
+        """Generate required action statement"""
+        if self.finding_type is FindingType.MRIA:
+            return f"""The Board of Directors is required to immediately ensure that management develops and implements
+a comprehensive remediation plan to address the deficiencies noted above. This plan must include specific
+milestones, responsible parties, and completion dates. A written response must be submitted to the Federal
+Reserve within {min(30, self.timeframe_days)} days of this letter."""
+        else:
+            return f"""The Board of Directors is required to ensure that management develops and implements an enhanced
+{_RA_LOWER[self.risk_area]} framework that addresses the deficiencies noted above. A detailed corrective
+action plan should be submitted to the Federal Reserve within {min(90, self.timeframe_days)} days, with full
+implementation expected within {self.timeframe_days} days of this letter."""
 
-            RiskArea.LIQUIDITY_RISK: """The Bank's liquidity risk management framework has material weaknesses.
-Internal liquidity stress testing does not adequately capture the Bank's funding vulnerabilities,
-particularly related to the concentration of uninsured deposits ({pct}% of total deposits). The Bank's
-contingency funding plan has not been updated since {year} and does not reflect current balance sheet composition.
 
-Our examination included a thorough review of the Bank's asset-liability management practices, funding strategies, and
-liquidity risk monitoring systems. We identified significant concerns regarding the Bank's reliance on volatile funding sources,
-including brokered deposits totaling ${broker_deposits}M ({broker_pct}% of total deposits) and borrowings from the Federal
-Home Loan Bank of ${fhlb_amount}M. The Bank's internal liquidity stress scenarios do not adequately consider the potential
-for concurrent deposit outflows and reduced borrowing capacity during stressed conditions.
+for _name in ("description", "impact", "required_action"):
+    setattr(ExaminationFinding, _name, _lazy_text(_name))
+del _name
 
-Additionally, the Bank's liquidity buffer consists primarily of investment securities with embedded interest rate risk,
-and the contingent borrowing capacity has not been validated through test transactions in over {months} months. The funds
-management committee meets only quarterly, which is insufficient given the current volatility in funding markets and the
-Bank's aggressive growth strategy. Management information systems do not provide real-time visibility into deposit flows
-or concentration metrics, limiting the Bank's ability to respond quickly to emerging liquidity pressures.""",
 
-            RiskArea.BSA_AML: """The Bank's BSA/AML compliance program has material deficiencies. Customer due
-diligence procedures are inadequate for {pct}% of higher-risk customer relationships reviewed. The suspicious
-activity monitoring system generated {issue_count} alerts that were inadequately investigated.
+@dataclass(**_SLOTS)
+class CAMELSExamination:
+    """Represents a full CAMELS examination"""
+    bank: BankProfile
+    exam_start_date: datetime
+    exam_end_date: datetime
+    report_date: datetime
+    examination_type: str = "Full-Scope"
+    findings: List[ExaminationFinding] = field(default_factory=list)
+    loan_sample_pct: float = 0.0
+    examiner_in_charge: str = ""
 
-The examination included a comprehensive review of the Bank's BSA/AML compliance program, including customer due diligence,
-suspicious activity monitoring, currency transaction reporting, and OFAC compliance. We identified systemic deficiencies in
-the Bank's ability to identify, monitor, and report potentially suspicious activity. The Bank processed {alert_count} alerts
-during the review period, but only filed {sar_count} Suspicious Activity Reports, raising concerns about the adequacy of
-alert disposition and investigation processes.
+    _date_strings: Dict[Tuple[str, str], Tuple[datetime, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-The Bank's customer risk rating methodology does not adequately consider all relevant risk factors, including geographic risk,
-product/service risk, and customer behavior. We identified {high_risk_count} high-risk customer relationships that lacked
-enhanced due diligence documentation, including {pep_count} politically exposed persons and {msb_count} money service businesses.
-Transaction monitoring scenarios have not been validated or tuned in over {validation_months} months, and several scenarios
-are generating excessive false positive alerts without proper management review or optimization.
+    _latest_prior: Optional[ExamHistorySnapshot] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    report_date_long = _date_text("report_date", LONG_DATE)
+    report_date_short = _date_text("report_date", SHORT_DATE)
+    exam_start_long = _date_text("exam_start_date", LONG_DATE)
+    exam_end_long = _date_text("exam_end_date", LONG_DATE)
+
+    def __post_init__(self):
+        """Initialize examination details"""
+        if not self.examiner_in_charge:
+            self.examiner_in_charge = self._generate_examiner_name()
+        if self.loan_sample_pct == 0.0:
+            self.loan_sample_pct = round(_default_rng().uniform(20, 50), 1)
+
+    def _generate_examiner_name(self) -> str:
+        """Generate realistic examiner name"""
+        return _default_rng().choice(_EXAMINER_NAMES)
+
+    def latest_prior_snapshot(self) -> Optional[ExamHistorySnapshot]:
+        """Get the most recent prior examination snapshot (computed once)"""
+        if self._latest_prior is None and self.bank.prior_examinations:
+            self._latest_prior = max(self.bank.prior_examinations, key=_EXAM_DATE)
+        return self._latest_prior
+
+    def invalidate_prior_snapshot(self) -> None:
+        """Forget the cached snapshot after ``bank.prior_examinations`` changes"""
+        self._latest_prior = None
+
+
+# ============================================================================
+# DOCUMENT TEMPLATES
+# ============================================================================
+# Repeated per-finding blocks, parsed once and rendered with str.format_map
+
+FINDING_TEMPLATE = """
+{sep}
+FINDING #{i}: {title}
+{sep}
+
+Type: {ftype}
+Severity: {severity}
+Risk Area: {risk_area}
+
+Description:
+{description}
+
+Impact:
+{impact}
+
+Required Action:
+{required_action}
+
+Context:
+- Composite Rating: {composite}
+- Exam Loan Sample: {sample_pct}% of portfolio reviewed
+- Total Assets: ${assets} million; Business Model: {bmodel}
+- Expected Remediation Timeline: {timeframe_days} days
+- Citations: {citations}
+"""
+
+MRIA_TEMPLATE = """MRIA #{idx}: {title}
+
+Issue: {description}
+Required Action: Submit a remediation plan by {due_date} that includes milestones, responsible parties, and board approval steps.
+
+"""
+
+_CAMELS_SUMMARY_TMPL = """
+{sep}
+SUMMARY OF EXAMINATION RATINGS
+{sep}
+
+Institution: {bank_name}
+RSSD: {rssd}
+Total Assets: ${assets} million
+Location: {city}, {state}
+
+Examination Period: {start} to {end}
+Report Date: {report_date}
+Examination Type: {examination_type}
+
+UNIFORM FINANCIAL INSTITUTIONS RATING SYSTEM (CAMELS)
+
+Current Ratings:
+    Composite:          {composite_rating}
+    Capital:            {capital_rating}
+    Asset Quality:      {asset_quality_rating}
+    Management:         {management_rating}
+    Earnings:           {earnings_rating}
+    Liquidity:          {liquidity_rating}
+    Sensitivity:        {sensitivity_rating}
+
+Rating Definitions:
+    1 = Strong - Highest rating indicating strong performance and risk management
+    2 = Satisfactory - Satisfactory performance and risk management
+    3 = Fair - Financial condition or risk management has weaknesses
+    4 = Marginal - Serious financial weaknesses or unsatisfactory risk management
+    5 = Unsatisfactory - Critical financial weaknesses and inadequate risk management
+
+FINANCIAL PERFORMANCE SUMMARY
+
+Capital Ratios:
+    Tier 1 Leverage Ratio:          {tier1_leverage}%
+    Total Risk-Based Capital:       {total_rbc}%
+
+Asset Quality:
+    NPAs / Total Assets:            {npa_ratio}%
+
+Earnings:
+    Return on Assets (ROA):         {roa}%
+    Return on Equity (ROE):         {roe}%
+    Net Interest Margin (NIM):      {nim}%
+    Efficiency Ratio:               {efficiency_ratio}%
+
+Liquidity:
+    Loan to Deposit Ratio:          {loan_to_deposit}%
+
+EXAMINATION SCOPE
+
+This was a {examination_type_lower} examination of {bank_name}.
+Examination procedures included a review of {sample_pct}% of the commercial loan portfolio,
+assessment of risk management practices across all major risk areas, evaluation of internal controls,
+and review of compliance with applicable laws and regulations.
+
+DETAILED COMPONENT ANALYSIS
+
+{component_analysis}
+
+MATTERS REQUIRING ATTENTION
+
+The examination identified {n_findings} supervisory matter{total_plural}
+requiring attention, including {n_mria} matter{mria_plural}
+requiring immediate attention (MRIA) and {n_mra} matter{mra_plural}
+requiring attention (MRA).
+
+Detailed findings and required corrective actions are provided in the separate supervisory letter dated
+{report_date}. The Bank must develop and implement comprehensive remediation plans to address
+all identified matters within the specified timeframes. The Federal Reserve will conduct follow-up examinations to assess
+progress in addressing these supervisory concerns.
+
+CONCLUSION
+
+This CAMELS rating reflects the Bank's financial condition, risk management practices, and compliance with applicable laws and
+regulations as of {end}. The Bank should continue to {maintain_or_enhance}
+its financial condition and risk management frameworks to ensure safe and sound operations. The Board and management should
+address all supervisory matters in a timely and effective manner and should contact the Federal Reserve with any questions
+regarding supervisory expectations or examination findings.
+
+{sep}
+"""
+
+# Literal closing sections of the supervisory letter (no substitutions)
+_CLOSING_BOARD_RESPONSIBILITIES = """BOARD RESPONSIBILITIES
+
+The Board of Directors has ultimate responsibility for ensuring the safe and sound operation of the Bank. The Board should:
+
+- Review and discuss this letter at the next regularly scheduled Board meeting
+- Ensure that management develops comprehensive corrective action plans for each matter
+- Establish clear accountability and assign responsibility for remediation efforts
+- Monitor progress regularly through detailed management reporting
+- Ensure adequate resources are allocated to address identified deficiencies
+- Consider engaging external expertise if internal capabilities are insufficient
+- Communicate regularly with the Federal Reserve regarding remediation progress
+
+The Federal Reserve expects the Board to maintain active oversight of the Bank's risk profile and to ensure that management
+operates the Bank in a safe and sound manner in compliance with applicable laws and regulations. The Board should ensure that
+the Bank has appropriate risk management frameworks, internal controls, and governance structures to identify, measure, monitor,
+and control risks across all material business activities.
+
+"""
+
+_CLOSING_REGULATORY_EXPECTATIONS = """REGULATORY EXPECTATIONS
+
+The Federal Reserve emphasizes the importance of timely and effective remediation of the matters identified in this letter.
+The Bank should prioritize remediation efforts based on the severity and potential impact of each matter, with immediate attention
+to matters requiring immediate attention. Management should provide the Board with regular updates on remediation progress, including
+status updates on action plan milestones, identification of any impediments to timely completion, and requests for additional resources
+if needed.
+
+The Bank should ensure that all corrective actions are sustainable and that appropriate policies, procedures, systems, and controls
+are in place to prevent recurrence of similar deficiencies. The Federal Reserve will evaluate the adequacy of the Bank's corrective
+actions through ongoing supervision and follow-up examinations.
+
+This letter is considered confidential supervisory information and should be maintained in the Bank's examination records. Distribution
+should be limited to the Board of Directors, senior management, and other individuals with a need to know. Unauthorized disclosure
+of confidential supervisory information may result in regulatory sanctions.
+
+"""
+
+_STREET_NAMES = ("Market Street", "Main Street", "First Avenue")
+
+# LFBO rating table row: component | previous rating | current rating
+ROW_FMT = "{:<32} | {:<30} | {:<30}".format
+LFBO_TABLE_HEADER = ROW_FMT("Component", "Previous Rating", "Current Rating")
+LFBO_TABLE_RULE = "-" * len(LFBO_TABLE_HEADER)
+
+LFBO_TEMPLATE = """BOARD OF GOVERNORS
+OF THE
+FEDERAL RESERVE SYSTEM
+
+LFBO DEDICATED SUPERVISORY TEAM LEAD
+LARGE INSTITUTIONS SUPERVISION GROUP
+SUPERVISION + CREDIT
+
+{report_date}
+
+RESTRICTED FR // EXTERNAL
+TRANSMITTED BY SECURE EMAIL
+
+Board of Directors
+{bank_name}
+{street_number} {street}
+{city}, {state}
+
+Subject: LFBO Component Rating Communication
+
+Dear Board Members:
+
+This letter conveys the Large Financial Institution (LFI) rating conclusions for {bank_name} (RSSD {rssd}).
+The Federal Reserve's assessment reflects the body of horizontal, firm-specific, and continuous monitoring work,
+and is {prior_text}.
 
-Additionally, the BSA Officer position has experienced {turnover_count} turnovers in the past {turnover_years} years, and
-current BSA staffing levels are inadequate given the Bank's risk profile and transaction volumes. Independent testing of the
-BSA/AML program identified {testing_issues} issues in the prior examination cycle, and management has not fully addressed
-these deficiencies. The Board receives limited information regarding BSA/AML compliance, and board members demonstrated
-limited understanding of the Bank's BSA/AML risk exposure during examination interviews.""",
-        }
+LFI Rating Summary
+{rating_table}
 
-        template = templates.get(self.risk_area,
-            """Examiners identified deficiencies in the Bank's {risk_area} framework. During our review, we noted
-{issue_count} instances where the Bank's practices did not meet supervisory expectations.
+Supervisory Assessment
 
-Our examination included a detailed assessment of the Bank's policies, procedures, and operational controls related to
-{risk_area}. We reviewed {sample_size} transactions and activities, interviewed key personnel, and analyzed management
-reporting systems. The examination revealed gaps in risk identification, measurement, monitoring, and control processes.
+Capital Planning & Positions remain {capital_desc}.
+The Tier 1 leverage ratio is {tier1}%.
+The total risk-based capital ratio is {total_rbc}%.
 
-Specific deficiencies include inadequate board and senior management oversight, insufficient staffing and expertise,
-outdated or incomplete policies and procedures, and management information systems that do not provide timely and accurate
-risk reporting. These weaknesses limit the Bank's ability to effectively manage {risk_area} and increase the potential for
-operational losses, regulatory sanctions, and reputational damage.""")
-
-        return template.format(
-            risk_area=self.risk_area.value,
-            issue_count=random.randint(5, 25),
-            loan_amount=round(random.uniform(10, 150), 1),
-            pct=random.randint(15, 45),
-            year=random.randint(2019, 2023),
-            sample_size=random.randint(50, 200),
-            sample_pct=random.randint(20, 50),
-            exception_count=random.randint(15, 45),
-            broker_deposits=round(random.uniform(50, 500), 1),
-            broker_pct=random.randint(10, 30),
-            fhlb_amount=round(random.uniform(100, 800), 1),
-            months=random.randint(12, 36),
-            alert_count=random.randint(500, 5000),
-            sar_count=random.randint(5, 50),
-            high_risk_count=random.randint(20, 80),
-            pep_count=random.randint(2, 15),
-            msb_count=random.randint(5, 25),
-            validation_months=random.randint(18, 48),
-            turnover_count=random.randint(2, 5),
-            turnover_years=random.randint(2, 4),
-            testing_issues=random.randint(8, 20),
-        )
+Liquidity Risk Management is {liquidity_desc}.
+The loan-to-deposit ratio is {ltd}%.
+Stress testing discussions highlighted depositor behavior sensitivities and contingency funding assumptions requiring continued refinement.
 
-    def _generate_impact(self) -> str:
-        """Generate impact statement"""
-        impact_templates = {
-            Severity.LOW: "These deficiencies present moderate risk to the Bank's safety and soundness if not addressed.",
-            Severity.MODERATE: "These deficiencies present elevated risk to the Bank and could adversely impact financial condition if left unaddressed.",
-            Severity.HIGH: "These deficiencies present significant risk to the Bank's safety and soundness and require prompt corrective action.",
-            Severity.CRITICAL: "These deficiencies pose an immediate threat to the Bank's viability and must be addressed without delay."
-        }
-        return impact_templates[self.severity]
+Governance & Controls are {management_desc}, reflecting the linkage between risk management, earnings, and asset quality.
+Nonperforming assets measure {npa}% of total assets, {npa_assessment};
+return on assets of {roa}% {roa_assessment}.
 
-    def _generate_required_action(self) -> str:
-        """Generate required action statement"""
-        if self.finding_type == FindingType.MRIA:
-            return f"""The Board of Directors is required to immediately ensure that management develops and implements
-a comprehensive remediation plan to address the deficiencies noted above. This plan must include specific
-milestones, responsible parties, and completion dates. A written response must be submitted to the Federal
-Reserve within {min(30, self.timeframe_days)} days of this letter."""
-        else:
-            return f"""The Board of Directors is required to ensure that management develops and implements an enhanced
-{self.risk_area.value.lower()} framework that addresses the deficiencies noted above. A detailed corrective
-action plan should be submitted to the Federal Reserve within {min(90, self.timeframe_days)} days, with full
-implementation expected within {self.timeframe_days} days of this letter."""
+Supervisory Expectations
 
+The following actions are required to address outstanding supervisory concerns:
+"""
 
-@dataclass
-class CAMELSExamination:
-    """Represents a full CAMELS examination"""
-    bank: BankProfile
-    exam_start_date: datetime
-    exam_end_date: datetime
-    report_date: datetime
-    examination_type: str = "Full-Scope"
-    findings: List[ExaminationFinding] = field(default_factory=list)
-    loan_sample_pct: float = 0.0
-    examiner_in_charge: str = ""
+LFBO_CLOSING_TEMPLATE = """
+• Provide quarterly updates describing progress against capital planning milestones and liquidity monetization triggers.
 
-    def __post_init__(self):
-        """Initialize examination details"""
-        if not self.examiner_in_charge:
-            self.examiner_in_charge = self._generate_examiner_name()
-        if self.loan_sample_pct == 0.0:
-            self.loan_sample_pct = round(random.uniform(20, 50), 1)
+The Federal Reserve will monitor remediation through ongoing supervision and targeted work. Please engage your Dedicated Supervisory
+Team Lead if clarification is required.
 
-    def _generate_examiner_name(self) -> str:
-        """Generate realistic examiner name"""
-        first_names = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer"]
-        last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia"]
-        return f"{random.choice(first_names)} {random.choice(last_names)}"
+Sincerely,
 
-    def latest_prior_snapshot(self) -> Optional[ExamHistorySnapshot]:
-        """Get the most recent prior examination snapshot"""
-        if not self.bank.prior_examinations:
-            return None
-        return max(self.bank.prior_examinations, key=lambda x: x.exam_date)
+{examiner}
+LFBO Dedicated Supervisory Team Lead
+Large Institutions Supervision Group
+
+CONFIDENTIAL SUPERVISORY INFORMATION
+"""
 
 
 # ============================================================================
 # TEXT GENERATION FUNCTIONS
 # ============================================================================
 
-def generate_supervisory_letter(
+def _s(n: int) -> str:
+    """Plural suffix for a count"""
+    return ("", "s")[n != 1]
+
+
+def _classify_findings(findings: List[ExaminationFinding]) -> Tuple[List[ExaminationFinding], int]:
+    """Split findings in a single pass into (MRIA findings, number of MRAs)"""
+    mrias = []
+    n_mra = 0
+    for f in findings:
+        if f.finding_type is FindingType.MRIA:
+            mrias.append(f)
+        elif f.finding_type is FindingType.MRA:
+            n_mra += 1
+    return mrias, n_mra
+
+
+def _stream_supervisory_letter(
     examination: CAMELSExamination,
     findings: List[ExaminationFinding],
-) -> str:
-    """Generate supervisory letter text."""
-
+    write: Callable[[str], object],
+    rng: Optional[random.Random] = None,
+) -> None:
+    """Emit supervisory letter text section by section through ``write``"""
+
+    rng = rng or _default_rng()
+    report_str = examination.report_date_long
+    end_str = examination.exam_end_long
+    start_str = examination.exam_start_long
+    assets_str = examination.bank.formatted["assets_m"]
     prior = examination.latest_prior_snapshot()
-    assets_change = ((examination.bank.total_assets - (prior.total_assets if prior and hasattr(prior, 'total_assets') else examination.bank.total_assets * 0.9)) /
-                    (prior.total_assets if prior and hasattr(prior, 'total_assets') else examination.bank.total_assets * 0.9) * 100) if prior else random.uniform(-5, 15)
+    if prior:
+        total_assets = examination.bank.total_assets
+        # Snapshots do not normally record total assets; assume ~10% growth since then
+        prev_assets = prior.total_assets if hasattr(prior, 'total_assets') else total_assets * 0.9
+        assets_change = (total_assets - prev_assets) / prev_assets * 100
+    else:
+        assets_change = rng.uniform(-5, 15)
+
+    n_branches = rng.randint(1, 8)
+    mrias, _ = _classify_findings(findings)
+    has_mria = bool(mrias)
+    risk_values = [_RA_VALUE[f.risk_area] for f in findings]
 
-    letter = f"""
+    write(f"""
 BOARD OF GOVERNORS
 OF THE
 FEDERAL RESERVE SYSTEM
@@ -400,7 +1019,7 @@ WASHINGTON, D.C. 20551
 
 DIVISION OF SUPERVISION AND REGULATION
 
-{examination.report_date.strftime('%B %d, %Y')}
+{report_str}
 
 CONFIDENTIAL SUPERVISORY INFORMATION
 
@@ -411,35 +1030,35 @@ Board of Directors
 Dear Members of the Board:
 
 This letter summarizes supervisory concerns identified during the examination of {examination.bank.name}
-(RSSD {examination.bank.rssd}) conducted by the Federal Reserve Bank as of {examination.exam_end_date.strftime('%B %d, %Y')}.
+(RSSD {examination.bank.rssd}) conducted by the Federal Reserve Bank as of {end_str}.
 The examination was conducted in accordance with Federal Reserve System policies and procedures and covered the period
-from {examination.exam_start_date.strftime('%B %d, %Y')} through {examination.exam_end_date.strftime('%B %d, %Y')}.
+from {start_str} through {end_str}.
 
 EXECUTIVE SUMMARY
 
-The Bank operates as a {examination.bank.business_model.value.lower()} institution with total assets of ${examination.bank.total_assets:,.1f} million
+The Bank operates as a {examination.bank.business_model.value.lower()} institution with total assets of ${assets_str} million
 as of the examination date, representing {'+' if assets_change > 0 else ''}{assets_change:.1f}% {'growth' if assets_change > 0 else 'contraction'} since the prior examination.
-The Bank was chartered on {examination.bank.charter_date.strftime('%B %d, %Y')} and operates {random.randint(1, 8)} {'branch' if random.randint(1, 8) == 1 else 'branches'} in
-{examination.bank.location[0]}, {examination.bank.location[1]}{' and surrounding communities' if random.randint(1, 8) > 1 else ''}.
+The Bank was chartered on {examination.bank.charter_date.strftime(LONG_DATE)} and operates {n_branches} {'branch' if n_branches == 1 else 'branches'} in
+{examination.bank.location[0]}, {examination.bank.location[1]}{' and surrounding communities' if n_branches > 1 else ''}.
 
 The examination scope included a comprehensive review of the Bank's financial condition, risk management practices, and compliance
 with applicable laws and regulations. Examiners conducted detailed assessments of capital adequacy, asset quality, management capabilities,
 earnings performance, liquidity position, and sensitivity to market risk. The examination team reviewed approximately {examination.loan_sample_pct}%
-of the Bank's loan portfolio, totaling ${examination.bank.total_assets * random.uniform(0.15, 0.30):,.1f} million, and conducted interviews with
-{random.randint(12, 25)} members of the Board, senior management, and key personnel.
+of the Bank's loan portfolio, totaling ${examination.bank.total_assets * rng.uniform(0.15, 0.30):,.1f} million, and conducted interviews with
+{rng.randint(12, 25)} members of the Board, senior management, and key personnel.
 
-The examination reviewed the Bank's {', '.join([f.risk_area.value for f in findings[:3]])}{',' if len(findings) > 3 else ''}
-{' and other areas' if len(findings) > 3 else ''} and identified {len(findings)} matter{'s' if len(findings) != 1 else ''}
-requiring {'immediate ' if any(f.finding_type == FindingType.MRIA for f in findings) else ''}attention.
-{'These matters represent significant concerns regarding the Banks safety and soundness' if any(f.finding_type == FindingType.MRIA for f in findings) else 'These matters require Board attention and management action'}
+The examination reviewed the Bank's {', '.join(risk_values[:3])}{',' if len(findings) > 3 else ''}
+{' and other areas' if len(findings) > 3 else ''} and identified {len(findings)} matter{_s(len(findings))}
+requiring {'immediate ' if has_mria else ''}attention.
+{'These matters represent significant concerns regarding the Banks safety and soundness' if has_mria else 'These matters require Board attention and management action'}
 and must be addressed in accordance with the timelines specified in this letter.
 
 EXAMINATION SCOPE AND METHODOLOGY
 
-The examination team consisted of {random.randint(4, 12)} examiners and specialists who spent {random.randint(15, 45)} days on-site and conducted
+The examination team consisted of {rng.randint(4, 12)} examiners and specialists who spent {rng.randint(15, 45)} days on-site and conducted
 additional off-site analysis. The examination included the following key activities:
 
-- Review of board and committee meeting minutes from the past {random.randint(12, 24)} months
+- Review of board and committee meeting minutes from the past {rng.randint(12, 24)} months
 - Analysis of the Bank's strategic plan, budget, and financial projections
 - Assessment of the loan portfolio through statistical sampling and targeted transaction testing
 - Evaluation of the Bank's internal audit function and independent risk review processes
@@ -450,59 +1069,56 @@ additional off-site analysis. The examination included the following key activit
 
 The examination was led by {examination.examiner_in_charge}, Examiner-in-Charge, with support from specialists in credit risk,
 operational risk, compliance, and information technology. The examination findings and conclusions were discussed with the
-Board of Directors and senior management during the exit meeting on {examination.exam_end_date.strftime('%B %d, %Y')}.
-
-"""
-
-    # Add each finding
-    for i, finding in enumerate(findings, 1):
-        letter += f"""
-{'='*80}
-FINDING #{i}: {finding.title}
-{'='*80}
-
-Type: {finding.finding_type.value}
-Severity: {finding.severity.value}
-Risk Area: {finding.risk_area.value}
-
-Description:
-{finding.description}
-
-Impact:
-{finding.impact}
-
-Required Action:
-{finding.required_action}
-
-Context:
-- Composite Rating: {examination.bank.composite_rating}
-- Exam Loan Sample: {examination.loan_sample_pct}% of portfolio reviewed
-- Total Assets: ${examination.bank.total_assets:,.1f} million; Business Model: {examination.bank.business_model.value}
-- Expected Remediation Timeline: {finding.timeframe_days} days
-- Citations: {CITATIONS_BY_RISK.get(finding.risk_area.value, 'Applicable supervisory guidance and CFR references')}
-"""
+Board of Directors and senior management during the exit meeting on {end_str}.
+
+""")
+
+    # Add each finding (context lines are the same for every finding)
+    context = {
+        "sep": SEP80,
+        "composite": examination.bank.composite_rating,
+        "sample_pct": examination.loan_sample_pct,
+        "assets": assets_str,
+        "bmodel": examination.bank.business_model.value,
+    }
+    write("".join([
+        FINDING_TEMPLATE.format_map(dict(
+            context,
+            i=i,
+            title=finding.title,
+            ftype=_FT_VALUE[finding.finding_type],
+            severity=_SEV_VALUE[finding.severity],
+            risk_area=risk_area,
+            description=finding.description,
+            impact=finding.impact,
+            required_action=finding.required_action,
+            timeframe_days=finding.timeframe_days,
+            citations=_CITATIONS_BY_RISK_ENUM[finding.risk_area],
+        ))
+        for i, (finding, risk_area) in enumerate(zip(findings, risk_values), 1)
+    ]))
 
     # MRIA Appendix
-    mrias = [f for f in findings if f.finding_type == FindingType.MRIA]
-    if mrias:
-        letter += f"""
-{'='*80}
+    if has_mria:
+        write(f"""
+{SEP80}
 APPENDIX I: MATTERS REQUIRING IMMEDIATE ATTENTION (MRIAs)
-{'='*80}
+{SEP80}
 
-"""
+""")
+        report_date = examination.report_date
         for idx, finding in enumerate(mrias, 1):
-            due_date = examination.report_date + timedelta(days=finding.timeframe_days)
-            letter += f"""MRIA #{idx}: {finding.title}
-
-Issue: {finding.description}
-Required Action: Submit a remediation plan by {due_date.strftime('%B %d, %Y')} that includes milestones, responsible parties, and board approval steps.
-
-"""
+            due_date = report_date + timedelta(days=finding.timeframe_days)
+            write(MRIA_TEMPLATE.format_map({
+                "idx": idx,
+                "title": finding.title,
+                "description": finding.description,
+                "due_date": due_date.strftime(LONG_DATE),
+            }))
 
     # Closing
-    letter += f"""
-{'='*80}
+    write(f"""
+{SEP80}
 
 The Board of Directors should review this letter and provide a written response addressing the
 findings noted above. Please contact {examination.examiner_in_charge}, the examiner-in-charge,
@@ -514,7 +1130,7 @@ The Board of Directors is responsible for ensuring that management develops and
 plans to address all matters identified in this letter. Each corrective action plan must include specific action steps,
 responsible parties, implementation timelines, and metrics for measuring progress and effectiveness.
 
-The Bank is required to submit written responses to the Federal Reserve within {'30 days' if mrias else '90 days'} of the date
+The Bank is required to submit written responses to the Federal Reserve within {'30 days' if has_mria else '90 days'} of the date
 of this letter, describing the corrective actions that have been or will be taken to address each matter. The response should
 include detailed action plans with milestones and expected completion dates. Management should provide regular progress updates
 to the Board of Directors, and the Board should ensure appropriate oversight of remediation efforts.
@@ -524,40 +1140,10 @@ matters identified in this letter. Failure to take timely and effective correcti
 measures, including formal enforcement actions. The Board and senior management should contact the Federal Reserve if they have
 questions regarding the matters identified in this letter or require clarification regarding supervisory expectations.
 
-BOARD RESPONSIBILITIES
-
-The Board of Directors has ultimate responsibility for ensuring the safe and sound operation of the Bank. The Board should:
-
-- Review and discuss this letter at the next regularly scheduled Board meeting
-- Ensure that management develops comprehensive corrective action plans for each matter
-- Establish clear accountability and assign responsibility for remediation efforts
-- Monitor progress regularly through detailed management reporting
-- Ensure adequate resources are allocated to address identified deficiencies
-- Consider engaging external expertise if internal capabilities are insufficient
-- Communicate regularly with the Federal Reserve regarding remediation progress
-
-The Federal Reserve expects the Board to maintain active oversight of the Bank's risk profile and to ensure that management
-operates the Bank in a safe and sound manner in compliance with applicable laws and regulations. The Board should ensure that
-the Bank has appropriate risk management frameworks, internal controls, and governance structures to identify, measure, monitor,
-and control risks across all material business activities.
-
-REGULATORY EXPECTATIONS
-
-The Federal Reserve emphasizes the importance of timely and effective remediation of the matters identified in this letter.
-The Bank should prioritize remediation efforts based on the severity and potential impact of each matter, with immediate attention
-to matters requiring immediate attention. Management should provide the Board with regular updates on remediation progress, including
-status updates on action plan milestones, identification of any impediments to timely completion, and requests for additional resources
-if needed.
-
-The Bank should ensure that all corrective actions are sustainable and that appropriate policies, procedures, systems, and controls
-are in place to prevent recurrence of similar deficiencies. The Federal Reserve will evaluate the adequacy of the Bank's corrective
-actions through ongoing supervision and follow-up examinations.
-
-This letter is considered confidential supervisory information and should be maintained in the Bank's examination records. Distribution
-should be limited to the Board of Directors, senior management, and other individuals with a need to know. Unauthorized disclosure
-of confidential supervisory information may result in regulatory sanctions.
-
-If you have any questions regarding this letter or the matters identified herein, please contact {examination.examiner_in_charge} at
+""")
+    write(_CLOSING_BOARD_RESPONSIBILITIES)
+    write(_CLOSING_REGULATORY_EXPECTATIONS)
+    write(f"""If you have any questions regarding this letter or the matters identified herein, please contact {examination.examiner_in_charge} at
 the Federal Reserve Bank.
 
 Sincerely,
@@ -569,316 +1155,464 @@ Federal Reserve Bank
 CC: {examination.bank.name} Management
     Federal Reserve Bank Examination File
     Federal Reserve Board of Governors
-"""
-
-    return letter
-
-
-def generate_camels_summary(examination: CAMELSExamination) -> str:
-    """Generate CAMELS ratings summary section"""
-
-    bank = examination.bank
-
-    summary = f"""
-{'='*80}
-SUMMARY OF EXAMINATION RATINGS
-{'='*80}
-
-Institution: {bank.name}
-RSSD: {bank.rssd}
-Total Assets: ${bank.total_assets:,.1f} million
-Location: {bank.location[0]}, {bank.location[1]}
+""")
 
-Examination Period: {examination.exam_start_date.strftime('%B %d, %Y')} to {examination.exam_end_date.strftime('%B %d, %Y')}
-Report Date: {examination.report_date.strftime('%B %d, %Y')}
-Examination Type: {examination.examination_type}
 
-UNIFORM FINANCIAL INSTITUTIONS RATING SYSTEM (CAMELS)
-
-Current Ratings:
-    Composite:          {bank.composite_rating}
-    Capital:            {bank.capital_rating}
-    Asset Quality:      {bank.asset_quality_rating}
-    Management:         {bank.management_rating}
-    Earnings:           {bank.earnings_rating}
-    Liquidity:          {bank.liquidity_rating}
-    Sensitivity:        {bank.sensitivity_rating}
-
-Rating Definitions:
-    1 = Strong - Highest rating indicating strong performance and risk management
-    2 = Satisfactory - Satisfactory performance and risk management
-    3 = Fair - Financial condition or risk management has weaknesses
-    4 = Marginal - Serious financial weaknesses or unsatisfactory risk management
-    5 = Unsatisfactory - Critical financial weaknesses and inadequate risk management
-
-FINANCIAL PERFORMANCE SUMMARY
-
-Capital Ratios:
-    Tier 1 Leverage Ratio:          {bank.tier1_leverage}%
-    Total Risk-Based Capital:       {bank.total_rbc}%
-
-Asset Quality:
-    NPAs / Total Assets:            {bank.npa_ratio}%
+def generate_supervisory_letter(
+    examination: CAMELSExamination,
+    findings: List[ExaminationFinding],
+    rng: Optional[random.Random] = None,
+) -> str:
+    """Generate supervisory letter text (``rng`` defaults to the thread's generator)."""
+    buf = io.StringIO()
+    _stream_supervisory_letter(examination, findings, buf.write, rng)
+    return buf.getvalue()
 
-Earnings:
-    Return on Assets (ROA):         {bank.roa}%
-    Return on Equity (ROE):         {bank.roe}%
-    Net Interest Margin (NIM):      {bank.nim}%
-    Efficiency Ratio:               {bank.efficiency_ratio}%
 
-Liquidity:
-    Loan to Deposit Ratio:          {bank.loan_to_deposit}%
+# CAMELS component paragraphs: the phrase-filled text depends only on the
+# rating, so it is memoized per rating as a format template. Per-bank ratios
+# (and the words chosen from them) are filled in on every call.
 
-EXAMINATION SCOPE
+@lru_cache(maxsize=None)
+def _capital_template(rating: int) -> str:
+    """Capital (C) paragraph for ``rating`` with the ratios left as format fields"""
+    (cap_position, cap_planning, cap_stress, cap_raising, cap_channels, cap_sources, cap_process,
+     cap_considers) = CAPITAL_PHRASES[rating]
+    return f"""CAPITAL (C) - Rating: {rating}
 
-This was a {examination.examination_type.lower()} examination of {bank.name}.
-Examination procedures included a review of {examination.loan_sample_pct}% of the commercial loan portfolio,
-assessment of risk management practices across all major risk areas, evaluation of internal controls,
-and review of compliance with applicable laws and regulations.
+The Capital component assesses the level and quality of capital and the overall financial condition of the institution.
+The Bank's Tier 1 Leverage Ratio of {{tier1_leverage}}% and Total Risk-Based Capital ratio of {{total_rbc}}%
+{{standing}} well-capitalized standards.
+Capital planning processes {cap_planning} and stress testing
+capabilities {cap_stress} supervisory expectations for an institution
+of this size and complexity.
 
-DETAILED COMPONENT ANALYSIS
+The Bank's capital position is {cap_position}
+relative to the Bank's risk profile. The Bank maintains {cap_raising} capital raising
+capabilities through {cap_channels} retained earnings
+{cap_sources}. The capital planning process
+{cap_process} that
+{cap_considers} the Bank's key risks and vulnerabilities."""
 
-CAPITAL (C) - Rating: {bank.capital_rating}
 
-The Capital component assesses the level and quality of capital and the overall financial condition of the institution.
-The Bank's Tier 1 Leverage Ratio of {bank.tier1_leverage}% and Total Risk-Based Capital ratio of {bank.total_rbc}%
-{'exceed' if bank.tier1_leverage > 8 else 'meet' if bank.tier1_leverage > 6 else 'fall below'} well-capitalized standards.
-Capital planning processes {'are adequate' if bank.capital_rating <= 2 else 'require improvement'} and stress testing
-capabilities {'align with' if bank.capital_rating <= 2 else 'do not meet'} supervisory expectations for an institution
-of this size and complexity.
+def _capital_paragraph(rating: int, tier1_leverage: float, total_rbc: float) -> str:
+    """Capital (C) component paragraph"""
+    return _capital_template(rating).format(
+        tier1_leverage=tier1_leverage,
+        total_rbc=total_rbc,
+        standing='exceed' if tier1_leverage > 8 else 'meet' if tier1_leverage > 6 else 'fall below',
+    )
 
-The Bank's capital position is {'strong' if bank.capital_rating == 1 else 'adequate' if bank.capital_rating == 2 else 'satisfactory' if bank.capital_rating == 3 else 'weak'}
-relative to the Bank's risk profile. The Bank maintains {'diverse' if bank.capital_rating <= 2 else 'limited'} capital raising
-capabilities through {'multiple channels including' if bank.capital_rating <= 2 else 'primarily'} retained earnings
-{', equity issuance, and subordinated debt' if bank.capital_rating <= 2 else ''}. The capital planning process
-{'incorporates comprehensive stress testing' if bank.capital_rating <= 2 else 'requires enhanced stress testing'} that
-{'adequately considers' if bank.capital_rating <= 2 else 'does not fully reflect'} the Bank's key risks and vulnerabilities.
 
-ASSET QUALITY (A) - Rating: {bank.asset_quality_rating}
+@lru_cache(maxsize=None)
+def _asset_quality_template(rating: int) -> str:
+    """Asset Quality (A) paragraph for ``rating`` with the ratios left as format fields"""
+    (aq_practices, aq_underwriting, aq_concentration, aq_problem_loans, aq_alll_method, aq_alll_factors,
+     aq_alll_level) = ASSET_QUALITY_PHRASES[rating]
+    return f"""ASSET QUALITY (A) - Rating: {rating}
 
 The Asset Quality component reflects the quantity of existing and potential credit risk associated with the loan and investment
-portfolios. The Bank's nonperforming assets to total assets ratio of {bank.npa_ratio}% is {'favorable' if bank.npa_ratio < 1 else 'acceptable' if bank.npa_ratio < 2 else 'elevated'}
+portfolios. The Bank's nonperforming assets to total assets ratio of {{npa_ratio}}% is {{npa_standing}}
 compared to peer institutions of similar size and business model.
 
-Credit risk management practices are {'sound' if bank.asset_quality_rating <= 2 else 'adequate' if bank.asset_quality_rating == 3 else 'weak'}
-with {'strong' if bank.asset_quality_rating <= 2 else 'acceptable' if bank.asset_quality_rating == 3 else 'inadequate'} underwriting
+Credit risk management practices are {aq_practices}
+with {aq_underwriting} underwriting
 standards, loan review processes, and portfolio monitoring systems. The loan portfolio composition reflects
-{'appropriate' if bank.asset_quality_rating <= 2 else 'elevated'} concentration risk in {bank.business_model.value.lower()} lending.
-Management {'maintains' if bank.asset_quality_rating <= 2 else 'should enhance'} effective problem loan identification and
+{aq_concentration} concentration risk in {{business_model}} lending.
+Management {aq_problem_loans} effective problem loan identification and
 workout processes.
 
-The Allowance for Loan and Lease Losses (ALLL) methodology is {'comprehensive and well-documented' if bank.asset_quality_rating <= 2 else 'adequate but requires improvement' if bank.asset_quality_rating == 3 else 'deficient'},
-incorporating {'appropriate' if bank.asset_quality_rating <= 2 else 'limited'} quantitative and qualitative risk factors.
-The current ALLL level of ${bank.total_assets * 0.012:,.2f} million ({round(random.uniform(0.8, 1.5), 2)}% of loans) is
-{'adequate' if bank.asset_quality_rating <= 2 else 'marginally adequate' if bank.asset_quality_rating == 3 else 'insufficient'}
-to absorb expected credit losses based on current portfolio risk characteristics.
+The Allowance for Loan and Lease Losses (ALLL) methodology is {aq_alll_method},
+incorporating {aq_alll_factors} quantitative and qualitative risk factors.
+The current ALLL level of ${{alll_amount:,.2f}} million ({{alll_pct}}% of loans) is
+{aq_alll_level}
+to absorb expected credit losses based on current portfolio risk characteristics."""
+
 
-MANAGEMENT (M) - Rating: {bank.management_rating}
+def _asset_quality_paragraph(
+    rating: int, npa_ratio: float, business_model: str, total_assets: float, alll_pct: float
+) -> str:
+    """Asset Quality (A) component paragraph"""
+    return _asset_quality_template(rating).format(
+        npa_ratio=npa_ratio,
+        npa_standing='favorable' if npa_ratio < 1 else 'acceptable' if npa_ratio < 2 else 'elevated',
+        business_model=business_model.lower(),
+        alll_amount=total_assets * 0.012,
+        alll_pct=alll_pct,
+    )
+
+
+@lru_cache(maxsize=None)
+def _management_paragraph(rating: int) -> str:
+    """Management (M) component paragraph"""
+    (mg_oversight, mg_planning, mg_understanding, mg_board_oversight, mg_committees, mg_expertise, mg_judgment,
+     mg_mis, mg_audit) = MANAGEMENT_PHRASES[rating]
+    return f"""MANAGEMENT (M) - Rating: {rating}
 
 The Management component reflects the capability of the board of directors and management to identify, measure, monitor, and
-control the risks of the institution's activities. Board and management oversight is {'strong' if bank.management_rating <= 2 else 'satisfactory' if bank.management_rating == 3 else 'weak'},
-with {'appropriate' if bank.management_rating <= 2 else 'adequate' if bank.management_rating == 3 else 'insufficient'} strategic
+control the risks of the institution's activities. Board and management oversight is {mg_oversight},
+with {mg_planning} strategic
 planning, risk management frameworks, and internal controls.
 
-The Board of Directors demonstrates {'strong' if bank.management_rating <= 2 else 'adequate' if bank.management_rating == 3 else 'limited'}
-understanding of the Bank's risk profile and provides {'active' if bank.management_rating <= 2 else 'satisfactory' if bank.management_rating == 3 else 'insufficient'}
-oversight through {'well-functioning' if bank.management_rating <= 2 else 'adequately structured' if bank.management_rating == 3 else 'ineffective'}
-board committees. Senior management possesses {'deep' if bank.management_rating <= 2 else 'sufficient' if bank.management_rating == 3 else 'limited'}
-industry expertise and {'demonstrates' if bank.management_rating <= 2 else 'generally demonstrates' if bank.management_rating == 3 else 'lacks'}
+The Board of Directors demonstrates {mg_understanding}
+understanding of the Bank's risk profile and provides {mg_board_oversight}
+oversight through {mg_committees}
+board committees. Senior management possesses {mg_expertise}
+industry expertise and {mg_judgment}
 sound judgment in managing the Bank's operations.
 
-Risk management information systems provide {'comprehensive and timely' if bank.management_rating <= 2 else 'adequate' if bank.management_rating == 3 else 'insufficient'}
-data to support decision-making. Internal audit and compliance functions are {'independent, adequately staffed, and effective' if bank.management_rating <= 2 else 'generally adequate but require enhancement' if bank.management_rating == 3 else 'deficient and require significant improvement'}.
+Risk management information systems provide {mg_mis}
+data to support decision-making. Internal audit and compliance functions are {mg_audit}."""
 
-EARNINGS (E) - Rating: {bank.earnings_rating}
+
+@lru_cache(maxsize=None)
+def _earnings_template(rating: int) -> str:
+    """Earnings (E) paragraph for ``rating`` with the ratios left as format fields"""
+    (ea_level, ea_capacity, ea_nonint, ea_lines, ea_targets, ea_provision,
+     ea_sustainability) = EARNINGS_PHRASES[rating]
+    return f"""EARNINGS (E) - Rating: {rating}
 
 The Earnings component measures current period earnings performance, sustainability of earnings, and the adequacy of provisions
-and reserves. The Bank's ROA of {bank.roa}% and ROE of {bank.roe}% are {'strong' if bank.earnings_rating <= 2 else 'acceptable' if bank.earnings_rating == 3 else 'weak'}
-relative to peers and demonstrate {'solid' if bank.earnings_rating <= 2 else 'acceptable' if bank.earnings_rating == 3 else 'weak'}
+and reserves. The Bank's ROA of {{roa}}% and ROE of {{roe}}% are {ea_level}
+relative to peers and demonstrate {ea_capacity}
 earnings capacity to support operations and capital growth.
 
-The Net Interest Margin of {bank.nim}% reflects {'effective' if bank.nim > 3.5 else 'adequate' if bank.nim > 3.0 else 'compressed'}
-spread management in the current interest rate environment. Noninterest income sources are {'diverse' if bank.earnings_rating <= 2 else 'limited'},
-with {'multiple' if bank.earnings_rating <= 2 else 'few'} fee-generating business lines. The efficiency ratio of {bank.efficiency_ratio}%
-indicates {'strong' if bank.efficiency_ratio < 60 else 'acceptable' if bank.efficiency_ratio < 70 else 'weak'} expense control
+The Net Interest Margin of {{nim}}% reflects {{nim_standing}}
+spread management in the current interest rate environment. Noninterest income sources are {ea_nonint},
+with {ea_lines} fee-generating business lines. The efficiency ratio of {{efficiency_ratio}}%
+indicates {{efficiency_standing}} expense control
 relative to revenue generation.
 
-Earnings {'consistently exceed' if bank.earnings_rating <= 2 else 'generally meet' if bank.earnings_rating == 3 else 'fall short of'}
-the Bank's internal performance targets and strategic objectives. Provision expense is {'appropriate' if bank.earnings_rating <= 2 else 'generally adequate' if bank.earnings_rating == 3 else 'insufficient'}
-relative to asset quality trends and portfolio growth. Earnings sustainability is {'strong' if bank.earnings_rating <= 2 else 'moderate' if bank.earnings_rating == 3 else 'uncertain'}
-considering competitive pressures, interest rate risks, and the Bank's strategic direction.
+Earnings {ea_targets}
+the Bank's internal performance targets and strategic objectives. Provision expense is {ea_provision}
+relative to asset quality trends and portfolio growth. Earnings sustainability is {ea_sustainability}
+considering competitive pressures, interest rate risks, and the Bank's strategic direction."""
+
+
+def _earnings_paragraph(rating: int, roa: float, roe: float, nim: float, efficiency_ratio: float) -> str:
+    """Earnings (E) component paragraph"""
+    return _earnings_template(rating).format(
+        roa=roa,
+        roe=roe,
+        nim=nim,
+        nim_standing='effective' if nim > 3.5 else 'adequate' if nim > 3.0 else 'compressed',
+        efficiency_ratio=efficiency_ratio,
+        efficiency_standing='strong' if efficiency_ratio < 60 else 'acceptable' if efficiency_ratio < 70 else 'weak',
+    )
+
 
-LIQUIDITY (L) - Rating: {bank.liquidity_rating}
+@lru_cache(maxsize=None)
+def _liquidity_template(rating: int) -> str:
+    """Liquidity (L) paragraph for ``rating`` with the loan-to-deposit ratio left as format fields"""
+    (li_processes, li_stress, li_funding, li_position, li_unencumbered, li_deposits,
+     li_volatility) = LIQUIDITY_PHRASES[rating]
+    return f"""LIQUIDITY (L) - Rating: {rating}
 
 The Liquidity component reflects the adequacy of the institution's current and prospective sources and uses of funds.
-The Bank's loan-to-deposit ratio of {bank.loan_to_deposit}% is {'conservative' if bank.loan_to_deposit < 80 else 'moderate' if bank.loan_to_deposit < 90 else 'aggressive'}
-relative to peers and provides {'ample' if bank.loan_to_deposit < 80 else 'adequate' if bank.loan_to_deposit < 90 else 'limited'}
+The Bank's loan-to-deposit ratio of {{loan_to_deposit}}% is {{ltd_stance}}
+relative to peers and provides {{ltd_capacity}}
 liquidity capacity for balance sheet growth or funding stress.
 
-Liquidity risk management processes are {'comprehensive' if bank.liquidity_rating <= 2 else 'satisfactory' if bank.liquidity_rating == 3 else 'deficient'},
-with {'robust' if bank.liquidity_rating <= 2 else 'adequate' if bank.liquidity_rating == 3 else 'weak'} stress testing,
-contingency funding planning, and liquidity buffer management. The Bank maintains {'diverse' if bank.liquidity_rating <= 2 else 'adequate' if bank.liquidity_rating == 3 else 'concentrated'}
+Liquidity risk management processes are {li_processes},
+with {li_stress} stress testing,
+contingency funding planning, and liquidity buffer management. The Bank maintains {li_funding}
 funding sources through core deposits, wholesale funding, and available borrowing lines.
 
-The liquidity position is {'strong' if bank.liquidity_rating <= 2 else 'satisfactory' if bank.liquidity_rating == 3 else 'tight'},
-with {'substantial' if bank.liquidity_rating <= 2 else 'adequate' if bank.liquidity_rating == 3 else 'limited'} unencumbered
-liquid assets available to meet cash flow needs. Deposit composition reflects {'stable' if bank.liquidity_rating <= 2 else 'moderate' if bank.liquidity_rating == 3 else 'elevated'}
-reliance on rate-sensitive and uninsured deposits, which {'does not present' if bank.liquidity_rating <= 2 else 'moderately increases' if bank.liquidity_rating == 3 else 'significantly increases'}
-funding volatility risk.
-
-SENSITIVITY TO MARKET RISK (S) - Rating: {bank.sensitivity_rating}
+The liquidity position is {li_position},
+with {li_unencumbered} unencumbered
+liquid assets available to meet cash flow needs. Deposit composition reflects {li_deposits}
+reliance on rate-sensitive and uninsured deposits, which {li_volatility}
+funding volatility risk."""
 
-The Sensitivity component reflects the degree to which changes in interest rates, foreign exchange rates, commodity prices, or
-equity prices can adversely affect earnings or capital. Interest rate risk is {'well-managed' if bank.sensitivity_rating <= 2 else 'adequately managed' if bank.sensitivity_rating == 3 else 'poorly managed'},
-with {'comprehensive' if bank.sensitivity_rating <= 2 else 'satisfactory' if bank.sensitivity_rating == 3 else 'weak'} measurement
-systems and {'effective' if bank.sensitivity_rating <= 2 else 'adequate' if bank.sensitivity_rating == 3 else 'insufficient'}
-hedging strategies to mitigate exposure.
 
-Asset-liability management processes {'effectively identify and control' if bank.sensitivity_rating <= 2 else 'adequately monitor' if bank.sensitivity_rating == 3 else 'do not adequately address'}
-interest rate risk arising from mismatches in repricing characteristics of assets and liabilities. The Bank's interest rate risk
-position is {'conservative' if bank.sensitivity_rating <= 2 else 'moderate' if bank.sensitivity_rating == 3 else 'elevated'},
-with earnings and capital {'well-protected' if bank.sensitivity_rating <= 2 else 'moderately exposed' if bank.sensitivity_rating == 3 else 'significantly vulnerable'}
-to adverse interest rate movements.
+def _liquidity_paragraph(rating: int, loan_to_deposit: float) -> str:
+    """Liquidity (L) component paragraph"""
+    return _liquidity_template(rating).format(
+        loan_to_deposit=loan_to_deposit,
+        ltd_stance='conservative' if loan_to_deposit < 80 else 'moderate' if loan_to_deposit < 90 else 'aggressive',
+        ltd_capacity='ample' if loan_to_deposit < 80 else 'adequate' if loan_to_deposit < 90 else 'limited',
+    )
 
-MATTERS REQUIRING ATTENTION
 
-The examination identified {len(examination.findings)} supervisory matter{'s' if len(examination.findings) != 1 else ''}
-requiring attention, including {sum(1 for f in examination.findings if f.finding_type == FindingType.MRIA)} matter{'s' if sum(1 for f in examination.findings if f.finding_type == FindingType.MRIA) != 1 else ''}
-requiring immediate attention (MRIA) and {sum(1 for f in examination.findings if f.finding_type == FindingType.MRA)} matter{'s' if sum(1 for f in examination.findings if f.finding_type == FindingType.MRA) != 1 else ''}
-requiring attention (MRA).
+@lru_cache(maxsize=None)
+def _sensitivity_paragraph(rating: int) -> str:
+    """Sensitivity (S) component paragraph"""
+    (se_irr, se_measurement, se_hedging, se_alm, se_position,
+     se_exposure) = SENSITIVITY_PHRASES[rating]
+    return f"""SENSITIVITY TO MARKET RISK (S) - Rating: {rating}
 
-Detailed findings and required corrective actions are provided in the separate supervisory letter dated
-{examination.report_date.strftime('%B %d, %Y')}. The Bank must develop and implement comprehensive remediation plans to address
-all identified matters within the specified timeframes. The Federal Reserve will conduct follow-up examinations to assess
-progress in addressing these supervisory concerns.
+The Sensitivity component reflects the degree to which changes in interest rates, foreign exchange rates, commodity prices, or
+equity prices can adversely affect earnings or capital. Interest rate risk is {se_irr},
+with {se_measurement} measurement
+systems and {se_hedging}
+hedging strategies to mitigate exposure.
 
-CONCLUSION
+Asset-liability management processes {se_alm}
+interest rate risk arising from mismatches in repricing characteristics of assets and liabilities. The Bank's interest rate risk
+position is {se_position},
+with earnings and capital {se_exposure}
+to adverse interest rate movements."""
 
-This CAMELS rating reflects the Bank's financial condition, risk management practices, and compliance with applicable laws and
-regulations as of {examination.exam_end_date.strftime('%B %d, %Y')}. The Bank should continue to {'maintain' if bank.composite_rating <= 2 else 'enhance'}
-its financial condition and risk management frameworks to ensure safe and sound operations. The Board and management should
-address all supervisory matters in a timely and effective manner and should contact the Federal Reserve with any questions
-regarding supervisory expectations or examination findings.
 
-{'='*80}
-"""
+def _stream_camels_summary(
+    examination: CAMELSExamination,
+    write: Callable[[str], object],
+    rng: Optional[random.Random] = None,
+) -> None:
+    """Emit the CAMELS ratings summary section through ``write``"""
 
-    return summary
+    rng = rng or _default_rng()
+    bank = examination.bank
+    report_str = examination.report_date_long
+    end_str = examination.exam_end_long
+    start_str = examination.exam_start_long
+    assets_str = bank.formatted["assets_m"]
+    mrias, n_mra = _classify_findings(examination.findings)
+    n_mria = len(mrias)
+    n_findings = len(examination.findings)
+    total_plural = _s(n_findings)
+    mria_plural = _s(n_mria)
+    mra_plural = _s(n_mra)
+    alll_pct = round(rng.uniform(0.8, 1.5), 2)
+    component_analysis = "\n\n".join((
+        _capital_paragraph(bank.capital_rating, bank.tier1_leverage, bank.total_rbc),
+        _asset_quality_paragraph(
+            bank.asset_quality_rating, bank.npa_ratio, bank.business_model.value, bank.total_assets, alll_pct
+        ),
+        _management_paragraph(bank.management_rating),
+        _earnings_paragraph(bank.earnings_rating, bank.roa, bank.roe, bank.nim, bank.efficiency_ratio),
+        _liquidity_paragraph(bank.liquidity_rating, bank.loan_to_deposit),
+        _sensitivity_paragraph(bank.sensitivity_rating),
+    ))
+
+    write(_CAMELS_SUMMARY_TMPL.format_map({
+        "sep": SEP80,
+        "bank_name": bank.name,
+        "rssd": bank.rssd,
+        "assets": assets_str,
+        "city": bank.location[0],
+        "state": bank.location[1],
+        "start": start_str,
+        "end": end_str,
+        "report_date": report_str,
+        "examination_type": examination.examination_type,
+        "examination_type_lower": examination.examination_type.lower(),
+        "composite_rating": bank.composite_rating,
+        "capital_rating": bank.capital_rating,
+        "asset_quality_rating": bank.asset_quality_rating,
+        "management_rating": bank.management_rating,
+        "earnings_rating": bank.earnings_rating,
+        "liquidity_rating": bank.liquidity_rating,
+        "sensitivity_rating": bank.sensitivity_rating,
+        "tier1_leverage": bank.tier1_leverage,
+        "total_rbc": bank.total_rbc,
+        "npa_ratio": bank.npa_ratio,
+        "roa": bank.roa,
+        "roe": bank.roe,
+        "nim": bank.nim,
+        "efficiency_ratio": bank.efficiency_ratio,
+        "loan_to_deposit": bank.loan_to_deposit,
+        "sample_pct": examination.loan_sample_pct,
+        "component_analysis": component_analysis,
+        "n_findings": n_findings,
+        "total_plural": total_plural,
+        "n_mria": n_mria,
+        "mria_plural": mria_plural,
+        "n_mra": n_mra,
+        "mra_plural": mra_plural,
+        "maintain_or_enhance": "maintain" if bank.composite_rating <= 2 else "enhance",
+    }))
+
+
+def generate_camels_summary(
+    examination: CAMELSExamination,
+    rng: Optional[random.Random] = None,
+) -> str:
+    """Generate CAMELS ratings summary section"""
+    buf = io.StringIO()
+    _stream_camels_summary(examination, buf.write, rng)
+    return buf.getvalue()
 
 
-def generate_lfbo_rating_letter(examination: CAMELSExamination) -> str:
-    """Generate an LFBO rating letter"""
+def _stream_lfbo_rating_letter(
+    examination: CAMELSExamination,
+    write: Callable[[str], object],
+    rng: Optional[random.Random] = None,
+) -> None:
+    """Emit an LFBO rating letter through ``write``"""
 
+    rng = rng or _default_rng()
     bank = examination.bank
     prior_snapshot = examination.latest_prior_snapshot()
+    formatted = bank.formatted
+    tier1_s = formatted["tier1"]
+    total_rbc_s = formatted["rbc"]
+    ltd_s = formatted["ltd"]
+    npa_s = formatted["npa"]
+    roa_s = formatted["roa"]
+    cap_desc = RATING_DESCRIPTIONS.get(bank.capital_rating, 'Not Rated')
+    liq_desc = RATING_DESCRIPTIONS.get(bank.liquidity_rating, 'Not Rated')
+    mgmt_desc = RATING_DESCRIPTIONS.get(bank.management_rating, 'Not Rated')
 
     # Build rating table
     rows = [
-        ("Capital Planning & Positions", 'capital', bank.capital_rating),
-        ("Liquidity Risk Management", 'liquidity', bank.liquidity_rating),
-        ("Governance & Controls", 'management', bank.management_rating)
+        ("Capital Planning & Positions", 'capital', cap_desc),
+        ("Liquidity Risk Management", 'liquidity', liq_desc),
+        ("Governance & Controls", 'management', mgmt_desc)
     ]
 
-    header = f"{'Component':<32} | {'Previous Rating':<30} | {'Current Rating':<30}"
-    table_lines = [header, "-" * len(header)]
+    current_date = examination.report_date_short
+    if prior_snapshot:
+        prior_date = prior_snapshot.exam_date_short
+        prev_texts = [
+            f"{RATING_DESCRIPTIONS.get(prior_snapshot.component_rating(component_key), 'Not Rated')} / {prior_date}"
+            for _, component_key, _ in rows
+        ]
+    else:
+        prev_texts = ["Not Previously Rated"] * len(rows)
 
-    for label, component_key, rating in rows:
-        current_text = f"{RATING_DESCRIPTIONS.get(rating, 'Not Rated')} / {examination.report_date.strftime('%m/%d/%Y')}"
-        if prior_snapshot:
-            prev_value = prior_snapshot.component_ratings.get(component_key, prior_snapshot.composite_rating)
-            prev_text = f"{RATING_DESCRIPTIONS.get(prev_value, 'Not Rated')} / {prior_snapshot.exam_date.strftime('%m/%d/%Y')}"
-        else:
-            prev_text = "Not Previously Rated"
-        table_lines.append(f"{label:<32} | {prev_text:<30} | {current_text:<30}")
+    table_lines = [LFBO_TABLE_HEADER, LFBO_TABLE_RULE] + [
+        ROW_FMT(label, prev_text, desc + ' / ' + current_date)
+        for (label, _, desc), prev_text in zip(rows, prev_texts)
+    ]
 
     rating_table = "\n".join(table_lines)
 
     # Generate address
-    street_numbers = random.randint(100, 9999)
-    street_names = ["Market Street", "Main Street", "First Avenue"]
-    street = random.choice(street_names)
+    street_numbers = rng.randint(100, 9999)
+    street = rng.choice(_STREET_NAMES)
 
     if prior_snapshot:
-        prior_text = f"previously communicated as {RATING_DESCRIPTIONS.get(prior_snapshot.composite_rating, 'Not Rated')} on {prior_snapshot.exam_date.strftime('%B %d, %Y')}"
+        prior_text = f"previously communicated as {RATING_DESCRIPTIONS.get(prior_snapshot.composite_rating, 'Not Rated')} on {prior_snapshot.exam_date_long}"
     else:
         prior_text = "being conveyed for the first time"
 
-    letter = f"""BOARD OF GOVERNORS
-OF THE
-FEDERAL RESERVE SYSTEM
-
-LFBO DEDICATED SUPERVISORY TEAM LEAD
-LARGE INSTITUTIONS SUPERVISION GROUP
-SUPERVISION + CREDIT
-
-{examination.report_date.strftime('%B %d, %Y')}
-
-RESTRICTED FR // EXTERNAL
-TRANSMITTED BY SECURE EMAIL
-
-Board of Directors
-{bank.name}
-{street_numbers} {street}
-{bank.location[0]}, {bank.location[1]}
+    write(LFBO_TEMPLATE.format(
+        report_date=examination.report_date_long,
+        bank_name=bank.name,
+        street_number=street_numbers,
+        street=street,
+        city=bank.location[0],
+        state=bank.location[1],
+        rssd=bank.rssd,
+        prior_text=prior_text,
+        rating_table=rating_table,
+        capital_desc=RATING_DESCRIPTIONS_LOWER.get(bank.capital_rating, 'not rated'),
+        tier1=tier1_s,
+        total_rbc=total_rbc_s,
+        liquidity_desc=RATING_DESCRIPTIONS_LOWER.get(bank.liquidity_rating, 'not rated'),
+        ltd=ltd_s,
+        management_desc=RATING_DESCRIPTIONS_LOWER.get(bank.management_rating, 'not rated'),
+        npa=npa_s,
+        npa_assessment='elevated relative to peers' if bank.npa_ratio > 2.5 else 'within peer tolerances',
+        roa=roa_s,
+        roa_assessment='remains pressured' if bank.roa < 0.8 else 'supports capital generation',
+    ))
 
-Subject: LFBO Component Rating Communication
+    # Add finding bullets
+    if examination.findings:
+        # Decorated (MRIA first, longest timeframe first, original order) so no key calls
+        keyed = [
+            (0 if f.finding_type is FindingType.MRIA else 1, -f.timeframe_days, i, f)
+            for i, f in enumerate(examination.findings)
+        ]
+        for *_, finding in heapq.nsmallest(4, keyed):
+            action = "Submit" if finding.finding_type is FindingType.MRIA else "Provide"
+            write(f"• {action} a detailed plan addressing {finding.title} within {min(90, finding.timeframe_days)} days.\n")
+    else:
+        write("• Provide a progress update on prior remediation plans within 60 days.\n")
 
-Dear Board Members:
+    write(LFBO_CLOSING_TEMPLATE.format(examiner=examination.examiner_in_charge))
 
-This letter conveys the Large Financial Institution (LFI) rating conclusions for {bank.name} (RSSD {bank.rssd}).
-The Federal Reserve's assessment reflects the body of horizontal, firm-specific, and continuous monitoring work,
-and is {prior_text}.
 
-LFI Rating Summary
-{rating_table}
+def generate_lfbo_rating_letter(
+    examination: CAMELSExamination,
+    rng: Optional[random.Random] = None,
+) -> str:
+    """Generate an LFBO rating letter"""
+    buf = io.StringIO()
+    _stream_lfbo_rating_letter(examination, buf.write, rng)
+    return buf.getvalue()
 
-Supervisory Assessment
 
-Capital Planning & Positions remain {RATING_DESCRIPTIONS.get(bank.capital_rating, 'Not Rated').lower()}.
-The Tier 1 leverage ratio is {bank.tier1_leverage:.1f}%.
-The total risk-based capital ratio is {bank.total_rbc:.1f}%.
+class DocumentBuilder:
+    """
+    Generates documents through one reusable in-memory buffer.
 
-Liquidity Risk Management is {RATING_DESCRIPTIONS.get(bank.liquidity_rating, 'Not Rated').lower()}.
-The loan-to-deposit ratio is {bank.loan_to_deposit:.1f}%.
-Stress testing discussions highlighted depositor behavior sensitivities and contingency funding assumptions requiring continued refinement.
+    Meant for loops producing many documents: the buffer is rewound between
+    documents instead of allocating a new one each time, and is replaced
+    once it has grown past ``MAX_BUFFER_CHARS`` so one very large document
+    does not pin that memory for the rest of the run.
+    """
 
-Governance & Controls are {RATING_DESCRIPTIONS.get(bank.management_rating, 'Not Rated').lower()}, reflecting the linkage between risk management, earnings, and asset quality.
-Nonperforming assets measure {bank.npa_ratio:.1f}% of total assets, {'elevated relative to peers' if bank.npa_ratio > 2.5 else 'within peer tolerances'};
-return on assets of {bank.roa:.2f}% {'remains pressured' if bank.roa < 0.8 else 'supports capital generation'}.
+    MAX_BUFFER_CHARS = 128 * 1024
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng
+        self._buf = io.StringIO()
+
+    def _render(self, stream: Callable[..., None], *args) -> str:
+        buf = self._buf
+        buf.seek(0)
+        buf.truncate(0)
+        stream(*args, buf.write, self.rng)
+        text = buf.getvalue()
+        if buf.tell() > self.MAX_BUFFER_CHARS:
+            self._buf = io.StringIO()
+        return text
+
+    def build_supervisory(
+        self,
+        examination: CAMELSExamination,
+        findings: Optional[List[ExaminationFinding]] = None
+    ) -> str:
+        """Supervisory letter (defaults to the examination's own findings)"""
+        if findings is None:
+            findings = examination.findings
+        return self._render(_stream_supervisory_letter, examination, findings)
+
+    def build_camels_summary(self, examination: CAMELSExamination) -> str:
+        """CAMELS ratings summary"""
+        return self._render(_stream_camels_summary, examination)
+
+    def build_lfbo(self, examination: CAMELSExamination) -> str:
+        """LFBO rating letter"""
+        return self._render(_stream_lfbo_rating_letter, examination)
 
-Supervisory Expectations
 
-The following actions are required to address outstanding supervisory concerns:
-"""
+# ============================================================================
+# BATCH GENERATION
+# ============================================================================
 
-    # Add finding bullets
-    if examination.findings:
-        sorted_findings = sorted(
-            examination.findings,
-            key=lambda f: (0 if f.finding_type == FindingType.MRIA else 1, -f.timeframe_days)
-        )
-        for finding in sorted_findings[:4]:
-            action = "Submit" if finding.finding_type == FindingType.MRIA else "Provide"
-            letter += f"• {action} a detailed plan addressing {finding.title} within {min(90, finding.timeframe_days)} days.\n"
-    else:
-        letter += "• Provide a progress update on prior remediation plans within 60 days.\n"
+def _reseed_worker() -> None:
+    """Give each worker process its own stream (forked workers inherit the parent's state)"""
+    set_seed(os.getpid() ^ time.time_ns())
 
-    letter += f"""
-• Provide quarterly updates describing progress against capital planning milestones and liquidity monetization triggers.
 
-The Federal Reserve will monitor remediation through ongoing supervision and targeted work. Please engage your Dedicated Supervisory
-Team Lead if clarification is required.
+def _one(examination: CAMELSExamination) -> str:
+    """Worker entry point: one supervisory letter for a pickled examination"""
+    return generate_supervisory_letter(examination, examination.findings)
 
-Sincerely,
 
-{examination.examiner_in_charge}
-LFBO Dedicated Supervisory Team Lead
-Large Institutions Supervision Group
+def generate_letters_batch(
+    examinations: List[CAMELSExamination],
+    max_workers: Optional[int] = None
+) -> List[str]:
+    """
+    Generate supervisory letters for many examinations across worker processes.
 
-CONFIDENTIAL SUPERVISORY INFORMATION
-"""
+    Args:
+        examinations: Examinations to write letters for
+        max_workers: Number of worker processes (defaults to the CPU count)
 
-    return letter
+    Returns:
+        Letters in the same order as ``examinations``
+    """
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=_reseed_worker
+    ) as ex:
+        return list(ex.map(_one, examinations, chunksize=8))
 
 
 # ============================================================================
@@ -935,12 +1669,14 @@ def create_sample_examination() -> CAMELSExamination:
         ExamHistorySnapshot(
             exam_date=datetime(2022, 6, 15),
             composite_rating=2,
-            component_ratings={'capital': 2, 'liquidity': 2, 'management': 2},
             tier1_leverage=9.5,
             total_rbc=13.2,
             npa_ratio=1.2,
             roa=1.0,
             loan_to_deposit=82.0,
+            capital_rating=2,
+            liquidity_rating=2,
+            management_rating=2,
         )
     )
 
@@ -967,14 +1703,40 @@ def generate_example_documents() -> Tuple[str, str, str]:
         Tuple of (supervisory_letter, camels_summary, lfbo_letter)
     """
     examination = create_sample_examination()
+    builder = DocumentBuilder()
 
-    supervisory_letter = generate_supervisory_letter(examination, examination.findings)
-    camels_summary = generate_camels_summary(examination)
-    lfbo_letter = generate_lfbo_rating_letter(examination)
+    supervisory_letter = builder.build_supervisory(examination, examination.findings)
+    camels_summary = builder.build_camels_summary(examination)
+    lfbo_letter = builder.build_lfbo(examination)
 
     return supervisory_letter, camels_summary, lfbo_letter
 
 
+def save_documents(
+    documents: List[Tuple[Union[str, os.PathLike], str]]
+) -> List[Union[str, os.PathLike]]:
+    """
+    Write (path, text) pairs as UTF-8, one unbuffered write per file where possible.
+
+    Returns:
+        The paths written, in order, as given
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    writev = getattr(os, "writev", None)  # not available on Windows
+    written = []
+    for path, text in documents:
+        data = memoryview(text.encode("utf-8"))
+        fd = os.open(path, flags, 0o666)  # same default as open(); the umask applies
+        try:
+            while data:
+                n = writev(fd, [data]) if writev else os.write(fd, data)
+                data = data[n:]
+        finally:
+            os.close(fd)
+        written.append(path)
+    return written
+
+
 # ============================================================================
 # MAIN - Example Usage
 # ============================================================================
@@ -985,17 +1747,12 @@ if __name__ == "__main__":
     supervisory_letter, camels_summary, lfbo_letter = generate_example_documents()
 
     # Save to files
-    with open("example_supervisory_letter.txt", "w") as f:
-        f.write(supervisory_letter)
-    print("✓ Saved: example_supervisory_letter.txt")
-
-    with open("example_camels_summary.txt", "w") as f:
-        f.write(camels_summary)
-    print("✓ Saved: example_camels_summary.txt")
-
-    with open("example_lfbo_letter.txt", "w") as f:
-        f.write(lfbo_letter)
-    print("✓ Saved: example_lfbo_letter.txt")
+    for path in save_documents([
+        ("example_supervisory_letter.txt", supervisory_letter),
+        ("example_camels_summary.txt", camels_summary),
+        ("example_lfbo_letter.txt", lfbo_letter),
+    ]):
+        print(f"✓ Saved: {path}")
 
     print("\nDone! All documents generated successfully.")
     print("\nYou can now copy this file to any Python project and use it standalone.")